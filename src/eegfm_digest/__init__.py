@@ -3,6 +3,7 @@ __all__ = [
     "config",
     "db",
     "eval_triage",
+    "jsonio",
     "keywords",
     "llm",
     "pdf",
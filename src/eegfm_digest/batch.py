@@ -10,6 +10,7 @@ from typing import Any
 
 from dotenv import load_dotenv
 
+from . import jsonio
 from .arxiv import fetch_month_candidates
 from .cache_meta import (
     SUMMARY_STAGE_LOGIC_VERSION,
@@ -62,13 +63,13 @@ class BatchRunConfig:
 
 
 def _load_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return jsonio.loads(path.read_bytes())
 
 
 def _load_jsonl(path: Path) -> list[dict[str, Any]]:
     if not path.exists():
         return []
-    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    return [jsonio.loads(line) for line in path.read_bytes().splitlines() if line.strip()]
 
 
 def load_featured_papers_map(path: Path) -> dict[str, str | None]:
@@ -330,7 +331,7 @@ def _run_summary_phase_for_month(
         )
     accepted = sorted(accepted, key=lambda x: (x["published"], x["arxiv_id_base"]))[: cfg.max_accepted]
 
-    summary_schema = _load_json(Path("schemas/summary.json"))
+    summary_schema = load_schema(Path("schemas/summary.json"))
     summarize_prompt = Path("prompts/summarize.md").read_text(encoding="utf-8")
     repair_prompt = Path("prompts/repair_json.md").read_text(encoding="utf-8")
     summary_descriptor = build_stage_descriptor(
@@ -424,6 +425,10 @@ def _run_summary_phase_for_month(
                     updated_at_source=str(paper.get("updated", "")).strip() or None,
                 ),
             )
+            if summary_call_meta.get("error"):
+                print(
+                    f"[summary] {month}: {aid} fell back to defaults: {summary_call_meta['error']}"
+                )
             print(f"[summary] {month}: summarized {aid}")
             if run_cfg.summary_sleep_seconds > 0:
                 time.sleep(run_cfg.summary_sleep_seconds)
@@ -34,6 +34,8 @@ class Config:
     llm_temperature_summary: float = 0.2
     llm_max_output_tokens_triage: int = 1024
     llm_max_output_tokens_summary: int = 2048
+    llm_concurrency: int = 1
+    llm_response_cache: bool = False
 
 
 def load_config() -> Config:
@@ -71,4 +73,6 @@ def load_config() -> Config:
         llm_temperature_summary=float(os.environ.get("LLM_TEMPERATURE_SUMMARY", "0.2")),
         llm_max_output_tokens_triage=int(os.environ.get("LLM_MAX_OUTPUT_TOKENS_TRIAGE", "1024")),
         llm_max_output_tokens_summary=int(os.environ.get("LLM_MAX_OUTPUT_TOKENS_SUMMARY", "2048")),
+        llm_concurrency=max(1, int(os.environ.get("LLM_CONCURRENCY", "1"))),
+        llm_response_cache=os.environ.get("LLM_RESPONSE_CACHE", "false").lower() in {"1", "true", "yes"},
     )
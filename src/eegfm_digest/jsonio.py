@@ -0,0 +1,43 @@
+"""JSON encoding helpers backed by orjson, with a stdlib fallback.
+
+Both backends use the same separators and indentation: compact by default, or
+two-space indentation when ``indent=True``. Non-ASCII text is written as UTF-8.
+Scalars are not byte-identical across backends: float formatting differs (``1e16``
+vs ``1e+16``), NaN/Infinity become ``null`` under orjson but ``NaN`` under the
+stdlib, and integers wider than 64 bits raise ``TypeError`` only under orjson.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(value: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(value, option=option)
+    if indent:
+        text = json.dumps(value, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+    else:
+        text = json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+    return text.encode("utf-8")
+
+
+def dumps_str(value: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+    return dumps(value, indent=indent, sort_keys=sort_keys).decode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
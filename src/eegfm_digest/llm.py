@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import sqlite3
+import threading
 import time
-from dataclasses import dataclass, replace
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
 from typing import Any, Protocol
 
+from . import jsonio
+
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 GOOGLE_OPENAI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/openai/"
 GOOGLE_PROVIDER_ALIASES = {"google", "google_ai_studio", "gemini"}
@@ -215,6 +223,151 @@ class OpenAICall:
         )
 
 
+class LLMResponseCache:
+    """SQLite store of raw response text keyed by a hash of the full request."""
+
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared by concurrent LLM worker threads; access is serialized by the lock.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                  request_key TEXT PRIMARY KEY,
+                  response_text TEXT NOT NULL,
+                  created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+            self._conn.commit()
+
+    def get(self, request_key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_text FROM llm_responses WHERE request_key=?", (request_key,)
+            ).fetchone()
+        return str(row[0]) if row else None
+
+    def put(self, request_key: str, response_text: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO llm_responses(request_key, response_text) VALUES (?, ?)
+                ON CONFLICT(request_key) DO UPDATE SET
+                  response_text=excluded.response_text,
+                  created_at=CURRENT_TIMESTAMP
+                """,
+                (request_key, response_text),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class CacheStage:
+    """Responses recorded during one ``CachedLLMCall.stage()`` block."""
+
+    pending: list[tuple[str, str]] = field(default_factory=list)
+    discarded: bool = False
+
+    def discard(self) -> None:
+        self.discarded = True
+
+
+class CachedLLMCall:
+    """LLMCaller wrapper that replays stored responses for byte-identical requests.
+
+    The key covers provider, model, sampling settings, schema and prompt, so any
+    prompt/template/schema change misses the cache. Inside ``with llm.stage()`` fresh
+    responses are held back and only stored when the block exits normally without
+    ``discard()``; callers use that to keep the responses of stages that succeeded, so
+    failed or fallback outputs are retried rather than replayed. Calls outside a stage
+    are stored immediately. ``read=False`` still records fresh responses but never
+    replays them (used for forced re-runs).
+    """
+
+    def __init__(
+        self,
+        inner: LLMCaller,
+        config: LLMCallConfig,
+        cache: LLMResponseCache,
+        read: bool = True,
+    ):
+        self._inner = inner
+        self._config = config
+        self._cache = cache
+        self._read = read
+        self._schema_digests: dict[int, tuple[dict[str, Any], str]] = {}
+        # Stages are per thread: concurrent triage/summary workers each run their own.
+        self._local = threading.local()
+
+    @contextmanager
+    def stage(self) -> Iterator[CacheStage]:
+        stage = CacheStage()
+        previous = getattr(self._local, "stage", None)
+        self._local.stage = stage
+        try:
+            yield stage
+        finally:
+            self._local.stage = previous
+        if not stage.discarded:
+            for request_key, response_text in stage.pending:
+                self._cache.put(request_key, response_text)
+
+    def _schema_digest(self, schema: dict[str, Any] | None) -> str:
+        if schema is None:
+            return ""
+        cached = self._schema_digests.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+        digest = hashlib.blake2b(
+            json.dumps(schema, sort_keys=True, ensure_ascii=False).encode("utf-8"),
+            digest_size=16,
+            usedforsecurity=False,
+        ).hexdigest()
+        self._schema_digests[id(schema)] = (schema, digest)
+        return digest
+
+    def _request_key(self, prompt: str, schema: dict[str, Any] | None) -> str:
+        key = hashlib.blake2b(digest_size=16, usedforsecurity=False)
+        for part in (
+            normalize_provider(self._config.provider),
+            self._config.model,
+            repr(self._config.temperature),
+            str(self._config.max_output_tokens),
+            self._schema_digest(schema),
+            prompt,
+        ):
+            key.update(part.encode("utf-8"))
+            key.update(b"\0")
+        return key.hexdigest()
+
+    def call(self, prompt: str, schema: dict[str, Any] | None = None) -> LLMCallResult:
+        request_key = self._request_key(prompt, schema)
+        if self._read:
+            text = self._cache.get(request_key)
+            if text is not None:
+                return LLMCallResult(text=text, provider=self._config.provider, model=self._config.model)
+        result = self._inner.call(prompt, schema=schema)
+        stage = getattr(self._local, "stage", None)
+        if stage is None:
+            self._cache.put(request_key, result.text)
+        else:
+            stage.pending.append((request_key, result.text))
+        return result
+
+    def count_tokens(self, content: str) -> int:
+        return self._inner.count_tokens(content)
+
+    def close(self) -> None:
+        self._inner.close()
+
+
 def build_llm_call(config: LLMCallConfig) -> LLMCaller:
     provider = normalize_provider(config.provider)
     if provider in OPENAI_COMPAT_PROVIDER_ALIASES:
@@ -243,6 +396,12 @@ def load_api_key(provider: str | None = None) -> str:
 
 
 def parse_json_text(text: str) -> dict[str, Any]:
+    try:
+        return jsonio.loads(text)
+    except ValueError:
+        pass
+    # orjson is stricter than the stdlib (NaN, oversized ints); retry leniently
+    # and then scan for the first embedded JSON object.
     try:
         return json.loads(text)
     except json.JSONDecodeError:
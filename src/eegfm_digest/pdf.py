@@ -104,31 +104,38 @@ _HEADING_PATTERNS: dict[str, tuple[str, ...]] = {
 }
 
 
+# One alternation with a named group per section: a heading line is classified by a
+# single match instead of one attempt per section pattern. Sections are disjoint,
+# so the group that matched is the only section the line can belong to.
+_HEADING_RE = re.compile(
+    "|".join(
+        f"(?P<{section}>{'|'.join(patterns)})" for section, patterns in _HEADING_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+_TRAILING_SPACE_RE = re.compile(r"[ \t]+\n")
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+
+
 def _normalize_extracted_text(text: str) -> str:
     text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(r"[ \t]+\n", "\n", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _TRAILING_SPACE_RE.sub("\n", text)
+    text = _BLANK_RUN_RE.sub("\n\n", text)
     return text
 
 
-def _matches_heading(section: str, line: str) -> bool:
-    normalized = line.strip().lower()
-    for pattern in _HEADING_PATTERNS[section]:
-        if re.match(pattern, normalized, flags=re.IGNORECASE):
-            return True
-    return False
-
-
 def _find_headings(lines: list[str]) -> dict[str, int]:
     headings: dict[str, int] = {}
     for idx, raw in enumerate(lines):
         line = raw.strip()
         if not line or len(line) > 120:
             continue
-        for section in ("abstract", "introduction", "methods", "results", "conclusion"):
-            if section not in headings and _matches_heading(section, line):
-                headings[section] = idx
-                break
+        match = _HEADING_RE.match(line.lower())
+        if match is None or match.lastgroup in headings:
+            continue
+        headings[match.lastgroup] = idx
+        if len(headings) == len(_HEADING_PATTERNS):
+            break
     return headings
 
 
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
+from typing import TypeVar
 
 from .arxiv import fetch_month_candidates, fetch_window_candidates
 from .cache_meta import (
@@ -16,7 +23,15 @@ from .cache_meta import (
 )
 from .config import Config
 from .db import DigestDB
-from .llm import LLMCallConfig, LLMRateLimitError, build_llm_call, load_api_key, provider_base_url
+from .llm import (
+    CachedLLMCall,
+    LLMCallConfig,
+    LLMRateLimitError,
+    LLMResponseCache,
+    build_llm_call,
+    load_api_key,
+    provider_base_url,
+)
 from .pdf import download_pdf, extract_text, slice_paper_text
 from .render import build_digest, write_json, write_jsonl
 from .site import update_home, write_month_site
@@ -87,6 +102,67 @@ def _triage_view(triage: dict[str, object] | None) -> dict[str, object]:
     }
 
 
+# A corrupt or unreadable cache row skips the paper for this run instead of aborting it.
+_CACHE_READ_ERRORS = (sqlite3.Error, ValueError, TypeError)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _iter_concurrent(
+    fn: Callable[[_T], _R],
+    items: Iterable[_T],
+    max_workers: int,
+) -> Iterator[tuple[_T, Callable[[], _R]]]:
+    """Yield ``(item, get_result)`` in input order, running up to ``max_workers`` calls at once.
+
+    ``get_result()`` returns ``fn(item)`` or raises its exception. Items are pulled
+    lazily, so work done while producing them (e.g. PDF downloads) interleaves with
+    the calls. With ``max_workers <= 1`` each call runs on the caller's thread inside
+    ``get_result()``. Closing the iterator early cancels calls that have not started yet.
+    """
+    if max_workers <= 1:
+        for item in items:
+            yield item, partial(fn, item)
+        return
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: deque[tuple[_T, Future[_R]]] = deque()
+    try:
+        for item in items:
+            pending.append((item, executor.submit(fn, item)))
+            if len(pending) >= max_workers:
+                item, future = pending.popleft()
+                yield item, future.result
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _warn_skipped(stage: str, arxiv_id_base: str, exc: Exception) -> None:
+    print(
+        f"[pipeline] WARNING: {stage} failed for {arxiv_id_base}: "
+        f"{type(exc).__name__}: {exc}; skipping (will retry next run)",
+        file=sys.stderr,
+    )
+
+
+def _run_cached_stage(
+    llm: object,
+    call: Callable[[], tuple[dict[str, object], dict[str, object]]],
+) -> tuple[dict[str, object], dict[str, object]]:
+    """Run one triage/summary call; with a response cache, keep its responses only if it
+    did not fall back to defaults (fallback meta carries ``error``)."""
+    if not isinstance(llm, CachedLLMCall):
+        return call()
+    with llm.stage() as stage:
+        result, meta = call()
+        if meta.get("error"):
+            stage.discard()
+    return result, meta
+
+
 def _run_triage_call_with_meta(*args, **kwargs) -> tuple[dict[str, object], dict[str, object]]:
     if triage_paper is not _ORIGINAL_TRIAGE_PAPER:
         return triage_paper(*args, **kwargs), {"repair_used": False}
@@ -147,6 +223,12 @@ def run_month(
     )
     triage_llm = build_llm_call(triage_llm_config)
     summary_llm = build_llm_call(summary_llm_config)
+    response_cache: LLMResponseCache | None = None
+    if cfg.llm_response_cache:
+        # Replays identical requests (e.g. after a stage-logic bump); --force skips replay.
+        response_cache = LLMResponseCache(cfg.data_dir / "llm_responses.sqlite")
+        triage_llm = CachedLLMCall(triage_llm, triage_llm_config, response_cache, read=not force)
+        summary_llm = CachedLLMCall(summary_llm, summary_llm_config, response_cache, read=not force)
 
     try:
         triage_prompt = _read("prompts/triage.md")
@@ -172,17 +254,39 @@ def run_month(
         )
 
         # Stage 2: triage
-        triage_rows: list[dict] = []
+        # Cache lookups and DB writes stay on this thread; only LLM calls fan out.
+        triage_by_index: dict[int, dict] = {}
         triage_failure_count = 0
-        for paper in candidates:
+        uncached_triage: list[tuple[int, dict]] = []
+        for index, paper in enumerate(candidates):
             try:
                 cached = None if force else db.get_triage_with_meta(paper["arxiv_id_base"])
                 if cached and is_cache_current(cached.get("meta"), triage_descriptor["cache_version"]):
-                    result_raw = cached["data"]
+                    triage_by_index[index] = {"arxiv_id_base": paper["arxiv_id_base"], **_triage_view(cached["data"])}
                 else:
-                    result_raw, triage_call_meta = _run_triage_call_with_meta(
-                        paper, triage_llm, triage_prompt, repair_prompt, triage_schema
-                    )
+                    uncached_triage.append((index, paper))
+            except _CACHE_READ_ERRORS as exc:
+                triage_failure_count += 1
+                _warn_skipped("triage", paper["arxiv_id_base"], exc)
+
+        def _call_triage(item: tuple[int, dict]) -> tuple[dict, dict]:
+            return _run_cached_stage(
+                triage_llm,
+                partial(
+                    _run_triage_call_with_meta,
+                    item[1],
+                    triage_llm,
+                    triage_prompt,
+                    repair_prompt,
+                    triage_schema,
+                ),
+            )
+
+        triage_outcomes = _iter_concurrent(_call_triage, uncached_triage, cfg.llm_concurrency)
+        with closing(triage_outcomes):
+            for (index, paper), get_result in triage_outcomes:
+                try:
+                    result_raw, triage_call_meta = get_result()
                     db.upsert_triage(
                         month,
                         result_raw,
@@ -192,26 +296,14 @@ def run_month(
                             updated_at_source=str(paper.get("updated", "")).strip() or None,
                         ),
                     )
-                reasons_raw = result_raw.get("reasons", [])
-                if not isinstance(reasons_raw, list):
-                    reasons_raw = [str(reasons_raw)]
-                result = {
-                    "arxiv_id_base": paper["arxiv_id_base"],
-                    "decision": result_raw.get("decision", "reject"),
-                    "confidence": float(result_raw.get("confidence", 0.0)),
-                    "reasons": reasons_raw,
-                }
-                triage_rows.append(result)
-            except Exception as exc:
-                if isinstance(exc, LLMRateLimitError):
-                    raise
-                triage_failure_count += 1
-                print(
-                    f"[pipeline] WARNING: triage failed for {paper['arxiv_id_base']}: "
-                    f"{type(exc).__name__}: {exc}; skipping (will retry next run)",
-                    file=sys.stderr,
-                )
-                # Not written to DB so the paper is retried on the next run.
+                    triage_by_index[index] = {"arxiv_id_base": paper["arxiv_id_base"], **_triage_view(result_raw)}
+                except Exception as exc:
+                    if isinstance(exc, LLMRateLimitError):
+                        raise
+                    triage_failure_count += 1
+                    # Not written to DB so the paper is retried on the next run.
+                    _warn_skipped("triage", paper["arxiv_id_base"], exc)
+        triage_rows = [triage_by_index[index] for index in sorted(triage_by_index)]
 
         write_jsonl(month_out / "triage.jsonl", sorted(triage_rows, key=lambda x: x["arxiv_id_base"]))
 
@@ -233,89 +325,120 @@ def run_month(
         summary_map: dict[str, dict] = {}
         pdf_map: dict[str, dict[str, object | None]] = {}
         summary_failure_count = 0
-        for paper in accepted:
-            arxiv_id_base = paper["arxiv_id_base"]
-            pdf_state: dict[str, object | None] = _empty_pdf_state()
-            try:
-                cached_summary = None if force else db.get_summary_with_meta(arxiv_id_base)
-                if cached_summary and is_cache_current(cached_summary.get("meta"), summary_descriptor["cache_version"]):
-                    summaries.append(cached_summary["data"])
-                    summary_map[arxiv_id_base] = cached_summary["data"]
-                    pdf_map[arxiv_id_base] = pdf_state
-                    continue
-
-                raw_text = ""
-                notes = "summary_not_attempted"
-                if no_pdf:
-                    notes = "summary_skipped:no_pdf_mode"
-                    pdf_state = {
-                        "downloaded": False,
-                        "pdf_path": None,
-                        "text_path": None,
-                        "extract_meta": {"error": "no_pdf_mode"},
-                    }
-                elif not paper.get("links", {}).get("pdf"):
-                    notes = "summary_skipped:missing_pdf_link"
-                    pdf_state = {
-                        "downloaded": False,
-                        "pdf_path": None,
-                        "text_path": None,
-                        "extract_meta": {"error": "missing_pdf_link"},
-                    }
-                    summary_failure_count += 1
-                    print(
-                        f"[pipeline] WARNING: pdf missing for {arxiv_id_base}; "
-                        "skipping (will retry next run)",
-                        file=sys.stderr,
-                    )
-                else:
-                    pdf_path = month_out / "pdfs" / f"{arxiv_id_base}.pdf"
-                    txt_path = month_out / "text" / f"{arxiv_id_base}.txt"
-                    try:
-                        download_pdf(paper["links"]["pdf"], pdf_path, cfg.pdf_rate_limit_seconds)
-                        meta = extract_text(pdf_path, txt_path)
-                        raw_text = txt_path.read_text(encoding="utf-8") if txt_path.exists() else ""
+
+        # PDFs are fetched sequentially (rate limited) on this thread as summary calls
+        # consume jobs, so downloads interleave with the summary LLM calls.
+        def _summary_jobs() -> Iterator[tuple[dict, str, str]]:
+            nonlocal summary_failure_count
+            for paper in accepted:
+                arxiv_id_base = paper["arxiv_id_base"]
+                pdf_state: dict[str, object | None] = _empty_pdf_state()
+                job: tuple[dict, str, str] | None = None
+                try:
+                    cached_summary = None if force else db.get_summary_with_meta(arxiv_id_base)
+                    if cached_summary and is_cache_current(cached_summary.get("meta"), summary_descriptor["cache_version"]):
+                        summaries.append(cached_summary["data"])
+                        summary_map[arxiv_id_base] = cached_summary["data"]
+                        pdf_map[arxiv_id_base] = pdf_state
+                        continue
+
+                    raw_text = ""
+                    notes = "summary_not_attempted"
+                    if no_pdf:
+                        notes = "summary_skipped:no_pdf_mode"
                         pdf_state = {
-                            "downloaded": True,
-                            "pdf_path": str(pdf_path),
-                            "text_path": str(txt_path),
-                            "extract_meta": meta,
+                            "downloaded": False,
+                            "pdf_path": None,
+                            "text_path": None,
+                            "extract_meta": {"error": "no_pdf_mode"},
                         }
-                        notes = json.dumps(meta, sort_keys=True)
-                    except Exception as exc:
-                        notes = f"summary_skipped:pdf_failed:{type(exc).__name__}"
+                    elif not paper.get("links", {}).get("pdf"):
+                        notes = "summary_skipped:missing_pdf_link"
                         pdf_state = {
                             "downloaded": False,
-                            "pdf_path": str(pdf_path),
-                            "text_path": str(txt_path),
-                            "extract_meta": {"error": f"download_or_extract_failed:{type(exc).__name__}"},
+                            "pdf_path": None,
+                            "text_path": None,
+                            "extract_meta": {"error": "missing_pdf_link"},
                         }
                         summary_failure_count += 1
                         print(
-                            f"[pipeline] WARNING: pdf download/extract failed for "
-                            f"{arxiv_id_base}: {type(exc).__name__}: {exc}; "
+                            f"[pipeline] WARNING: pdf missing for {arxiv_id_base}; "
                             "skipping (will retry next run)",
                             file=sys.stderr,
                         )
-
-                if raw_text.strip():
-                    summary, summary_call_meta = _run_summary_call_with_meta(
-                        paper=paper,
-                        triage=triage_map[arxiv_id_base],
-                        raw_fulltext=raw_text,
-                        fulltext_slices=slice_paper_text(
-                            raw_text,
-                            excerpt_chars=18_000,
-                            tail_chars=cfg.text_tail_chars,
-                        ),
-                        used_fulltext=True,
-                        notes=notes,
-                        llm=summary_llm,
-                        prompt_template=summarize_prompt,
-                        repair_template=repair_prompt,
-                        schema=summary_schema,
-                        max_input_tokens=cfg.summary_max_input_tokens,
-                    )
+                    else:
+                        pdf_path = month_out / "pdfs" / f"{arxiv_id_base}.pdf"
+                        txt_path = month_out / "text" / f"{arxiv_id_base}.txt"
+                        try:
+                            download_pdf(paper["links"]["pdf"], pdf_path, cfg.pdf_rate_limit_seconds)
+                            meta = extract_text(pdf_path, txt_path)
+                            raw_text = txt_path.read_text(encoding="utf-8") if txt_path.exists() else ""
+                            pdf_state = {
+                                "downloaded": True,
+                                "pdf_path": str(pdf_path),
+                                "text_path": str(txt_path),
+                                "extract_meta": meta,
+                            }
+                            notes = json.dumps(meta, sort_keys=True)
+                        except Exception as exc:
+                            notes = f"summary_skipped:pdf_failed:{type(exc).__name__}"
+                            pdf_state = {
+                                "downloaded": False,
+                                "pdf_path": str(pdf_path),
+                                "text_path": str(txt_path),
+                                "extract_meta": {"error": f"download_or_extract_failed:{type(exc).__name__}"},
+                            }
+                            summary_failure_count += 1
+                            print(
+                                f"[pipeline] WARNING: pdf download/extract failed for "
+                                f"{arxiv_id_base}: {type(exc).__name__}: {exc}; "
+                                "skipping (will retry next run)",
+                                file=sys.stderr,
+                            )
+
+                    if raw_text.strip():
+                        job = (paper, raw_text, notes)
+                except _CACHE_READ_ERRORS as exc:
+                    summary_failure_count += 1
+                    _warn_skipped("summary", arxiv_id_base, exc)
+                pdf_map[arxiv_id_base] = pdf_state
+                if job is not None:
+                    yield job
+
+        def _call_summary(job: tuple[dict, str, str]) -> tuple[dict, dict]:
+            paper, raw_text, notes = job
+            summary_call = partial(
+                _run_summary_call_with_meta,
+                paper=paper,
+                triage=triage_map[paper["arxiv_id_base"]],
+                raw_fulltext=raw_text,
+                fulltext_slices=slice_paper_text(
+                    raw_text,
+                    excerpt_chars=18_000,
+                    tail_chars=cfg.text_tail_chars,
+                ),
+                used_fulltext=True,
+                notes=notes,
+                llm=summary_llm,
+                prompt_template=summarize_prompt,
+                repair_template=repair_prompt,
+                schema=summary_schema,
+                max_input_tokens=cfg.summary_max_input_tokens,
+            )
+            return _run_cached_stage(summary_llm, summary_call)
+
+        summary_outcomes = _iter_concurrent(_call_summary, _summary_jobs(), cfg.llm_concurrency)
+        with closing(summary_outcomes):
+            for (paper, _raw_text, _notes), get_result in summary_outcomes:
+                arxiv_id_base = paper["arxiv_id_base"]
+                try:
+                    summary, summary_call_meta = get_result()
+                    if summary_call_meta.get("error"):
+                        print(
+                            f"[pipeline] WARNING: summary fell back to defaults for "
+                            f"{arxiv_id_base}: {summary_call_meta['error']}",
+                            file=sys.stderr,
+                        )
                     summaries.append(summary)
                     summary_map[arxiv_id_base] = summary
                     db.upsert_summary(
@@ -327,16 +450,11 @@ def run_month(
                             updated_at_source=str(paper.get("updated", "")).strip() or None,
                         ),
                     )
-            except Exception as exc:
-                if isinstance(exc, LLMRateLimitError):
-                    raise
-                summary_failure_count += 1
-                print(
-                    f"[pipeline] WARNING: summary failed for {arxiv_id_base}: "
-                    f"{type(exc).__name__}: {exc}; skipping (will retry next run)",
-                    file=sys.stderr,
-                )
-            pdf_map[arxiv_id_base] = pdf_state
+                except Exception as exc:
+                    if isinstance(exc, LLMRateLimitError):
+                        raise
+                    summary_failure_count += 1
+                    _warn_skipped("summary", arxiv_id_base, exc)
 
         summaries = sorted(summaries, key=lambda x: (x["published_date"], x["arxiv_id_base"]))
         write_jsonl(month_out / "papers.jsonl", summaries)
@@ -388,6 +506,8 @@ def run_month(
     finally:
         triage_llm.close()
         summary_llm.close()
+        if response_cache is not None:
+            response_cache.close()
         db.close()
 
 
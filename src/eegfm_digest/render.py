@@ -5,6 +5,8 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
+from . import jsonio
+
 
 def pick_top_picks(summaries: list[dict[str, Any]], triage_map: dict[str, dict[str, Any]]) -> list[str]:
     ranked = sorted(
@@ -72,5 +74,8 @@ def write_json(path: Path, payload: Any) -> None:
 
 def write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    lines = [json.dumps(r, ensure_ascii=False, sort_keys=True) for r in rows]
-    path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+    # Stream one encoded row at a time instead of joining the whole month into one string.
+    with path.open("wb") as f:
+        for row in rows:
+            f.write(jsonio.dumps(row, sort_keys=True))
+            f.write(b"\n")
@@ -14,6 +14,8 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from . import jsonio
+
 CURRENT_VERSION = 1
 
 
@@ -67,7 +69,7 @@ def load_run_log(path: Path) -> RunLog | None:
     if not path.exists():
         return None
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = jsonio.loads(path.read_bytes())
     except json.JSONDecodeError as exc:
         raise RunLogError(f"invalid JSON in {path}: {exc}") from exc
     if not isinstance(data, dict):
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import copy
+import functools
 import hashlib
 import html
 import json
+import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from . import jsonio
+
 _SHORT_BLURB = (
     "This digest serves as a monthly update on the current EEG foundation model literature on arXiv. "
     "We filter with arXiv title and abstract keywords, and a triage LLM to decide on papers that qualify. "
@@ -145,6 +151,8 @@ def _safe_str_list(value: Any) -> list[str]:
 
 
 def _safe_float(value: Any) -> float:
+    if type(value) is float:
+        return value
     try:
         return float(value)
     except Exception:
@@ -152,6 +160,8 @@ def _safe_float(value: Any) -> float:
 
 
 def _safe_int(value: Any, default: int = 0) -> int:
+    if type(value) is int:
+        return value
     try:
         return int(value)
     except Exception:
@@ -229,7 +239,8 @@ def _paper_rows_from_summaries(
         arxiv_id_base = str(summary.get("arxiv_id_base", "")).strip()
         if not arxiv_id_base:
             continue
-        meta = metadata.get(arxiv_id_base, {}) if isinstance(metadata.get(arxiv_id_base, {}), dict) else {}
+        raw_meta = metadata.get(arxiv_id_base)
+        meta = raw_meta if isinstance(raw_meta, dict) else {}
         rows.append(
             {
                 "arxiv_id_base": arxiv_id_base,
@@ -317,15 +328,13 @@ def _month_payload(
         papers,
         digest.get("featured_paper"),
     )
+    summarized = sum(1 for p in papers if p.get("summary"))
     return {
         "month": month,
         "stats": {
             "candidates": _safe_int(stats.get("candidates", 0), 0),
             "accepted": _safe_int(stats.get("accepted", len(papers)), len(papers)),
-            "summarized": _safe_int(
-                stats.get("summarized", len([p for p in papers if p.get("summary")])),
-                len([p for p in papers if p.get("summary")]),
-            ),
+            "summarized": _safe_int(stats.get("summarized", summarized), summarized),
         },
         "featured_paper_id": featured_paper_id,
         "top_picks": [str(item) for item in top_picks],
@@ -333,19 +342,12 @@ def _month_payload(
     }
 
 
-def _about_digest_block(process_href: str, include_process_cta: bool = False) -> str:
-    cta = (
-        f"<p class='small'><a href='{html.escape(process_href)}'>Read the detailed process and prompt design</a></p>"
-        if include_process_cta
-        else ""
-    )
-    return (
-        "<section class='digest-about'>"
-        "<h2>About This Digest</h2>"
-        f"<p>{html.escape(_SHORT_BLURB)}</p>"
-        f"{cta}"
-        "</section>"
-    )
+_ABOUT_DIGEST_BLOCK = (
+    "<section class='digest-about'>"
+    "<h2>About This Digest</h2>"
+    f"<p>{html.escape(_SHORT_BLURB)}</p>"
+    "</section>"
+)
 
 
 def _load_prompt_text(path: Path) -> str:
@@ -380,6 +382,8 @@ def _header_contact_links_html() -> str:
     return "".join(links)
 
 
+# Only a handful of (relative-path, active-tab) combinations exist; build each once.
+@functools.lru_cache(maxsize=8)
 def _nav_html(
     home_href: str,
     explore_href: str,
@@ -495,6 +499,10 @@ def _tab_title(suffix: str | None = None) -> str:
     return f"{_SITE_TAB_TITLE_BASE} | {suffix}"
 
 
+# Static path segments in the month shell need no per-render escaping.
+_MONTH_PAGE_MANIFEST_JSON = html.escape("../../data/months.json")
+
+
 def render_month_page(
     month: str,
     summaries: list[dict[str, Any]],
@@ -502,9 +510,15 @@ def render_month_page(
     digest: dict[str, Any],
 ) -> str:
     del summaries, metadata, digest  # Render path is JSON-driven; data loads client-side.
+    return _month_page_shell(month)
+
+
+# The shell depends only on the month, so no payload hashing is needed to memoize it.
+@functools.lru_cache(maxsize=32)
+def _month_page_shell(month: str) -> str:
     month_attr = html.escape(month)
-    month_json = html.escape(f"../../digest/{month}/papers.json")
-    manifest_json = html.escape("../../data/months.json")
+    month_json = f"../../digest/{month_attr}/papers.json"
+    manifest_json = _MONTH_PAGE_MANIFEST_JSON
     month_title = html.escape(_month_label(month))
     month_tab_title = html.escape(_tab_title(_month_tab_label(month)))
     nav = _nav_html("../../index.html", "../../explore/index.html", "../../process/index.html", "home")
@@ -537,7 +551,7 @@ def render_home_page(months: list[str]) -> str:
 <link rel='stylesheet' href='assets/style.css?v={_ASSET_VERSION}'></head><body>
 {nav}
 <main id='digest-app' class='container' data-view='home' data-month='' data-manifest-json='data/months.json' data-fallback-months='{fallback_months}'>
-{_about_digest_block("process/index.html", include_process_cta=False)}
+{_ABOUT_DIGEST_BLOCK}
 <section id='home-controls' class='controls'></section>
 <section id='home-results'></section>
 </main>
@@ -564,6 +578,28 @@ def render_explore_page(months: list[str]) -> str:
 """
 
 
+def _json_bytes(value: Any) -> bytes:
+    return jsonio.dumps(value, indent=True, sort_keys=True) + b"\n"
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    # Rename is atomic, so readers of the published site never see a partial file.
+    os.replace(tmp_path, path)
+
+
 def write_month_site(
     docs_dir: Path,
     month: str,
@@ -578,29 +614,48 @@ def write_month_site(
         render_month_page(month, summaries, metadata, digest), encoding="utf-8"
     )
     payload = _month_payload(month, summaries, metadata, digest, backend_rows)
-    (month_dir / "papers.json").write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
-    (month_dir / "digest.json").write_text(
-        json.dumps(digest, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    _atomic_write_bytes(month_dir / "papers.json", _json_bytes(payload))
+    _atomic_write_bytes(month_dir / "digest.json", _json_bytes(digest))
+
+
+# Manifest rows keyed by papers.json path and its (mtime_ns, size, inode) signature.
+# Rows are only cached once the file is older than the mtime granularity window, so a
+# rewrite landing in the same timestamp tick can never be served from a stale entry.
+_MANIFEST_ROW_CACHE: dict[Path, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+_MANIFEST_CACHE_MIN_AGE_NS = 2_000_000_000
 
 
 def _month_manifest_item(month_dir: Path) -> dict[str, Any]:
-    month = month_dir.name
     payload_path = month_dir / "papers.json"
+    try:
+        st = payload_path.stat()
+    except OSError:
+        _MANIFEST_ROW_CACHE.pop(payload_path, None)
+        return _build_month_manifest_item(month_dir, None)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _MANIFEST_ROW_CACHE.get(payload_path)
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1])
+
+    try:
+        raw = payload_path.read_bytes()
+    except OSError:
+        raw = None
+    row = _build_month_manifest_item(month_dir, raw)
+    if raw is not None and time.time_ns() - st.st_mtime_ns > _MANIFEST_CACHE_MIN_AGE_NS:
+        _MANIFEST_ROW_CACHE[payload_path] = (signature, copy.deepcopy(row))
+    return row
+
+
+def _build_month_manifest_item(month_dir: Path, raw: bytes | None) -> dict[str, Any]:
+    month = month_dir.name
+    # The revision hashes the on-disk bytes and the same buffer is parsed.
     month_rev = "missing"
-    if payload_path.exists():
-        try:
-            month_rev = hashlib.sha256(payload_path.read_bytes()).hexdigest()[:16]
-        except Exception:
-            month_rev = "missing"
     payload: Any = {}
-    if payload_path.exists():
+    if raw is not None:
+        month_rev = hashlib.blake2b(raw, digest_size=8, usedforsecurity=False).hexdigest()
         try:
-            payload = json.loads(payload_path.read_text(encoding="utf-8"))
+            payload = jsonio.loads(raw)
         except Exception:
             payload = {}
 
@@ -621,10 +676,8 @@ def _month_manifest_item(month_dir: Path) -> dict[str, Any]:
         if isinstance(stats, dict):
             candidates = _safe_int(stats.get("candidates", 0), 0)
             accepted = _safe_int(stats.get("accepted", len(papers)), len(papers))
-            summarized = _safe_int(
-                stats.get("summarized", len([p for p in papers if isinstance(p.get("summary"), dict)])),
-                len([p for p in papers if isinstance(p.get("summary"), dict)]),
-            )
+            summarized_rows = sum(1 for p in papers if isinstance(p.get("summary"), dict))
+            summarized = _safe_int(stats.get("summarized", summarized_rows), summarized_rows)
     if candidates == 0:
         empty_state = "no_candidates"
     elif accepted == 0:
@@ -659,12 +712,14 @@ def _month_manifest_item(month_dir: Path) -> dict[str, Any]:
 
 
 def update_home(docs_dir: Path) -> None:
-    month_dirs = sorted(
-        [p for p in (docs_dir / "digest").iterdir() if p.is_dir()],
-        key=lambda p: p.name,
-        reverse=True,
-    ) if (docs_dir / "digest").exists() else []
-    months = [p.name for p in month_dirs]
+    digest_dir = docs_dir / "digest"
+    try:
+        # scandir reports entry types from the directory read, without a stat per month.
+        with os.scandir(digest_dir) as entries:
+            months = sorted((entry.name for entry in entries if entry.is_dir()), reverse=True)
+    except FileNotFoundError:
+        months = []
+    month_dirs = [digest_dir / month for month in months]
     (docs_dir / "index.html").write_text(render_home_page(months), encoding="utf-8")
     explore_dir = docs_dir / "explore"
     explore_dir.mkdir(parents=True, exist_ok=True)
@@ -678,8 +733,5 @@ def update_home(docs_dir: Path) -> None:
     }
     data_dir = docs_dir / "data"
     data_dir.mkdir(parents=True, exist_ok=True)
-    (data_dir / "months.json").write_text(
-        json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    _atomic_write_bytes(data_dir / "months.json", _json_bytes(manifest))
     (docs_dir / ".nojekyll").write_text("\n", encoding="utf-8")
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import json
+import copy
+import functools
 from typing import Any
 
+from . import jsonio
 from .llm import LLMCaller, parse_json_text
-from .triage import validate_json
+from .triage import SchemaValidationError, schema_prompt_json, validate_json
 
 TAG_TAXONOMY: dict[str, list[str]] = {
     "paper_type": ["new-model", "post-training", "benchmark", "survey"],
@@ -20,6 +22,15 @@ TAG_TAXONOMY: dict[str, list[str]] = {
 }
 
 
+# The taxonomy is sent with every summary prompt; serialize it once.
+_TAG_TAXONOMY_SETS: dict[str, frozenset[str]] = {
+    category: frozenset(values) for category, values in TAG_TAXONOMY.items()
+}
+_TAG_ALIASES: dict[str, dict[str, str]] = {
+    "paper_type": {"eeg-fm": "new-model"},
+}
+
+
 _PAPER_TYPE_FROM_TAG: dict[str, str] = {
     "new-model": "new_model",
     "eeg-fm": "new_model",
@@ -29,31 +40,37 @@ _PAPER_TYPE_FROM_TAG: dict[str, str] = {
 }
 
 
-def _summary_triage_payload(triage: dict[str, Any]) -> dict[str, Any]:
+def _base_payload(paper: dict[str, Any], triage: dict[str, Any]) -> dict[str, Any]:
+    confidence = triage.get("confidence", 0.0)
+    if type(confidence) is not float:
+        confidence = float(confidence)
     reasons = triage.get("reasons", [])
     if not isinstance(reasons, list):
         reasons = [str(reasons)]
+    # Invariant keys go first so every prompt shares the longest possible prefix
+    # for provider-side prompt caching.
     return {
-        "decision": triage.get("decision", "reject"),
-        "confidence": float(triage.get("confidence", 0.0)),
-        "reasons": reasons,
-    }
-
-
-def _base_payload(paper: dict[str, Any], triage: dict[str, Any]) -> dict[str, Any]:
-    return {
+        "allowed_tags": TAG_TAXONOMY,
         "arxiv_id_base": paper["arxiv_id_base"],
         "title": paper["title"],
         "published_date": paper["published"][:10],
         "categories": paper["categories"],
         "abstract": paper["summary"],
-        "triage": _summary_triage_payload(triage),
-        "allowed_tags": TAG_TAXONOMY,
+        "triage": {
+            "decision": triage.get("decision", "reject"),
+            "confidence": confidence,
+            "reasons": reasons,
+        },
     }
 
 
+@functools.lru_cache(maxsize=8)
+def _template_parts(prompt_template: str) -> tuple[str, ...]:
+    return tuple(prompt_template.split("{{INPUT_JSON}}"))
+
+
 def _render_prompt(prompt_template: str, payload: dict[str, Any]) -> str:
-    return prompt_template.replace("{{INPUT_JSON}}", json.dumps(payload, ensure_ascii=False))
+    return jsonio.dumps_str(payload).join(_template_parts(prompt_template))
 
 
 def _count_tokens_or_none(llm: LLMCaller, prompt: str) -> int | None:
@@ -74,25 +91,32 @@ def _select_payload(
     prompt_template: str,
     llm: LLMCaller,
     max_input_tokens: int,
-) -> tuple[dict[str, Any], str]:
-    base = _base_payload(paper, triage)
+) -> tuple[str, str]:
+    payload = _base_payload(paper, triage)
     if not raw_fulltext.strip():
-        return {**base, "fulltext_slices": fulltext_slices}, "input_mode=fulltext_slices;reason=missing_fulltext"
+        payload["fulltext_slices"] = fulltext_slices
+        return (
+            _render_prompt(prompt_template, payload),
+            "input_mode=fulltext_slices;reason=missing_fulltext",
+        )
 
-    payload_fulltext = {**base, "fulltext": raw_fulltext}
-    prompt_fulltext = _render_prompt(prompt_template, payload_fulltext)
+    # The payload is built fresh per call, so it is mutated in place rather than copied.
+    payload["fulltext"] = raw_fulltext
+    prompt_fulltext = _render_prompt(prompt_template, payload)
     token_count = _count_tokens_or_none(llm, prompt_fulltext)
 
     if token_count is not None and token_count <= max_input_tokens:
-        return payload_fulltext, f"input_mode=fulltext;prompt_tokens={token_count}"
+        return prompt_fulltext, f"input_mode=fulltext;prompt_tokens={token_count}"
 
+    del payload["fulltext"]
+    payload["fulltext_slices"] = fulltext_slices
+    prompt_slices = _render_prompt(prompt_template, payload)
     if token_count is None:
-        return {**base, "fulltext_slices": fulltext_slices}, "input_mode=fulltext_slices;reason=count_tokens_failed"
-
-    return {
-        **base,
-        "fulltext_slices": fulltext_slices,
-    }, f"input_mode=fulltext_slices;reason=fulltext_over_limit;prompt_tokens={token_count};max_tokens={max_input_tokens}"
+        return prompt_slices, "input_mode=fulltext_slices;reason=count_tokens_failed"
+    return (
+        prompt_slices,
+        f"input_mode=fulltext_slices;reason=fulltext_over_limit;prompt_tokens={token_count};max_tokens={max_input_tokens}",
+    )
 
 
 def _to_numeric_or_none(value: Any) -> float | None:
@@ -101,11 +125,11 @@ def _to_numeric_or_none(value: Any) -> float | None:
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str):
-        raw = value.strip().lower().replace(",", "").replace("+", "")
+        raw = value.strip().replace(",", "").replace("+", "")
         if not raw:
             return None
         mult = 1.0
-        if raw.endswith("k"):
+        if raw[-1] in "kK":
             mult = 1_000.0
             raw = raw[:-1]
         try:
@@ -115,26 +139,25 @@ def _to_numeric_or_none(value: Any) -> float | None:
     return None
 
 
-def _canonicalize_tag(category: str, value: str) -> str:
-    cleaned = value.strip()
-    if category == "paper_type" and cleaned == "eeg-fm":
-        return "new-model"
-    return cleaned
+def _identity_fields(paper: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "arxiv_id_base": paper["arxiv_id_base"],
+        "title": paper["title"],
+        "published_date": paper["published"][:10],
+        "categories": paper["categories"],
+    }
 
 
 def _normalize_summary_output(
     data: dict[str, Any],
-    paper: dict[str, Any],
+    identity: dict[str, Any],
     used_fulltext: bool,
     notes: str,
 ) -> dict[str, Any]:
     out = dict(data)
 
     # Deterministic identity fields come from metadata.
-    out["arxiv_id_base"] = paper["arxiv_id_base"]
-    out["title"] = paper["title"]
-    out["published_date"] = paper["published"][:10]
-    out["categories"] = paper["categories"]
+    out.update(identity)
     out["used_fulltext"] = used_fulltext
     out["notes"] = notes
 
@@ -144,25 +167,26 @@ def _normalize_summary_output(
         paper_type = paper_type[0] if paper_type else None
     if isinstance(paper_type, str):
         candidate = paper_type.strip()
-        if candidate in _PAPER_TYPE_FROM_TAG:
-            out["paper_type"] = _PAPER_TYPE_FROM_TAG[candidate]
-        else:
-            out["paper_type"] = candidate
+        out["paper_type"] = _PAPER_TYPE_FROM_TAG.get(candidate, candidate)
 
     tags = out.get("tags")
     if not isinstance(tags, dict):
         tags = {}
     normalized_tags: dict[str, list[str]] = {}
-    for category, allowed in TAG_TAXONOMY.items():
+    for category, allowed in _TAG_TAXONOMY_SETS.items():
+        aliases = _TAG_ALIASES.get(category, {})
         raw_values = tags.get(category, [])
         if isinstance(raw_values, str):
             raw_values = [raw_values]
         if not isinstance(raw_values, list):
             raw_values = []
         filtered: list[str] = []
+        seen_tags: set[str] = set()
         for value in raw_values:
-            value_str = _canonicalize_tag(category, str(value))
-            if value_str in allowed and value_str not in filtered:
+            value_str = str(value).strip()
+            value_str = aliases.get(value_str, value_str)
+            if value_str in allowed and value_str not in seen_tags:
+                seen_tags.add(value_str)
                 filtered.append(value_str)
             if len(filtered) >= 2:
                 break
@@ -177,15 +201,15 @@ def _normalize_summary_output(
         key_points = [key_points]
     if not isinstance(key_points, list):
         key_points = []
-    clean_points = [str(p).strip() for p in key_points if str(p).strip()]
-    clean_points = clean_points[:3]
+    clean_points = [point for point in (str(p).strip() for p in key_points) if point][:3]
     if len(clean_points) < 2:
-        fallback_points = [
+        seen_points = set(clean_points)
+        for fallback in (
             str(out.get("one_liner", "")).strip(),
             str(out.get("unique_contribution", "")).strip(),
-        ]
-        for fallback in fallback_points:
-            if fallback and fallback not in clean_points:
+        ):
+            if fallback and fallback not in seen_points:
+                seen_points.add(fallback)
                 clean_points.append(fallback)
             if len(clean_points) >= 2:
                 break
@@ -194,9 +218,8 @@ def _normalize_summary_output(
     data_scale = out.get("data_scale", {})
     if not isinstance(data_scale, dict):
         data_scale = {}
-    data_scale["datasets"] = (
-        data_scale.get("datasets", []) if isinstance(data_scale.get("datasets", []), list) else []
-    )
+    datasets = data_scale.get("datasets", [])
+    data_scale["datasets"] = datasets if isinstance(datasets, list) else []
     data_scale["subjects"] = _to_numeric_or_none(data_scale.get("subjects"))
     data_scale["eeg_hours"] = _to_numeric_or_none(data_scale.get("eeg_hours"))
     data_scale["channels"] = _to_numeric_or_none(data_scale.get("channels"))
@@ -205,6 +228,92 @@ def _normalize_summary_output(
     return out
 
 
+# Empty values for the nested objects; used to patch outputs that only drifted
+# structurally (missing containers or sub-keys) without another LLM round trip.
+_CONTAINER_DEFAULTS: dict[str, dict[str, Any]] = {
+    "data_scale": {"datasets": [], "subjects": None, "eeg_hours": None, "channels": None},
+    "method": {"architecture": None, "objective": None, "pretraining": None, "finetuning": None},
+    "evaluation": {"tasks": [], "benchmarks": [], "headline_results": []},
+    "open_source": {"code_url": None, "weights_url": None, "license": None},
+}
+
+_FALLBACK_SUMMARY_TEMPLATE: dict[str, Any] = {
+    "paper_type": "other",
+    "one_liner": "Summary unavailable due to JSON validation failure.",
+    "detailed_summary": "Unable to produce a reliable multi-sentence summary due to JSON validation failure.",
+    "unique_contribution": "unknown",
+    "key_points": ["unknown", "unknown", "unknown"],
+    **_CONTAINER_DEFAULTS,
+    "tags": {category: [] for category in TAG_TAXONOMY},
+    "limitations": ["unknown", "summary_json_error"],
+}
+
+
+def _fill_container_defaults(
+    data: dict[str, Any],
+    schema: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Add missing containers and sub-keys; None if the output drifted in any other way.
+
+    Present values are never replaced or dropped: a container of the wrong type or an
+    unknown key is left for the LLM repair pass.
+    """
+    allowed = schema.get("properties", {})
+    if any(key not in allowed for key in data):
+        return None
+    out = dict(data)
+    for key, defaults in _CONTAINER_DEFAULTS.items():
+        current = out.get(key, {})
+        if not isinstance(current, dict) or any(sub_key not in defaults for sub_key in current):
+            return None
+        out[key] = {
+            sub_key: current.get(sub_key, [] if default == [] else default)
+            for sub_key, default in defaults.items()
+        }
+    return out
+
+
+def _attempt_summary(
+    raw: str,
+    identity: dict[str, Any],
+    used_fulltext: bool,
+    notes: str,
+    schema: dict[str, Any],
+    local_repair: bool = False,
+) -> tuple[dict[str, Any] | None, str | None]:
+    parsed: Any = None
+    try:
+        parsed = parse_json_text(raw)
+        data = _normalize_summary_output(
+            data=parsed,
+            identity=identity,
+            used_fulltext=used_fulltext,
+            notes=notes,
+        )
+        validate_json(data, schema)
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    else:
+        return data, None
+    if not local_repair or not isinstance(parsed, dict):
+        return None, error
+    filled = _fill_container_defaults(parsed, schema)
+    if filled is None:
+        return None, error
+
+    try:
+        data = _normalize_summary_output(
+            data=filled,
+            identity=identity,
+            used_fulltext=used_fulltext,
+            notes=f"{notes};summary_local_repair",
+        )
+        validate_json(data, schema)
+    except (SchemaValidationError, TypeError, ValueError):
+        return None, error
+    return data, None
+
+
 def summarize_paper(
     paper: dict[str, Any],
     triage: dict[str, Any],
@@ -247,7 +356,7 @@ def summarize_paper_with_meta(
     schema: dict[str, Any],
     max_input_tokens: int,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
-    payload, mode_notes = _select_payload(
+    prompt, mode_notes = _select_payload(
         paper=paper,
         triage=triage,
         raw_fulltext=raw_fulltext,
@@ -257,66 +366,35 @@ def summarize_paper_with_meta(
         max_input_tokens=max_input_tokens,
     )
     merged_notes = f"{notes};{mode_notes}" if notes else mode_notes
-    prompt = _render_prompt(prompt_template, payload)
+    identity = _identity_fields(paper)
     raw = llm.call(prompt, schema=schema).text
-    try:
-        data = parse_json_text(raw)
-        data = _normalize_summary_output(
-            data=data,
-            paper=paper,
-            used_fulltext=used_fulltext,
-            notes=merged_notes,
-        )
-        validate_json(data, schema)
+    data, error = _attempt_summary(
+        raw, identity, used_fulltext, merged_notes, schema, local_repair=True
+    )
+    if data is not None:
         return data, {"repair_used": False}
-    except Exception:
-        repair_prompt = (
-            repair_template.replace("{{SCHEMA_JSON}}", json.dumps(schema, ensure_ascii=False))
-            .replace("{{BAD_OUTPUT}}", raw)
-        )
-        try:
-            repaired = llm.call(repair_prompt, schema=schema).text
-            data = parse_json_text(repaired)
-            data = _normalize_summary_output(
-                data=data,
-                paper=paper,
-                used_fulltext=used_fulltext,
-                notes=merged_notes,
-            )
-            validate_json(data, schema)
+
+    repair_prompt = (
+        repair_template.replace("{{SCHEMA_JSON}}", schema_prompt_json(schema))
+        .replace("{{BAD_OUTPUT}}", raw)
+    )
+    try:
+        repaired = llm.call(repair_prompt, schema=schema).text
+    except Exception as exc:
+        repaired = None
+        error = f"{type(exc).__name__}: {exc}"
+    if repaired is not None:
+        data, error = _attempt_summary(repaired, identity, used_fulltext, merged_notes, schema)
+        if data is not None:
             return data, {"repair_used": True}
-        except Exception:
-            # deterministic fallback with schema-compatible defaults
-            return (
-                {
-                    "arxiv_id_base": paper["arxiv_id_base"],
-                    "title": paper["title"],
-                    "published_date": paper["published"][:10],
-                    "categories": paper["categories"],
-                    "paper_type": "other",
-                    "one_liner": "Summary unavailable due to JSON validation failure.",
-                    "detailed_summary": "Unable to produce a reliable multi-sentence summary due to JSON validation failure.",
-                    "unique_contribution": "unknown",
-                    "key_points": ["unknown", "unknown", "unknown"],
-                    "data_scale": {"datasets": [], "subjects": None, "eeg_hours": None, "channels": None},
-                    "method": {
-                        "architecture": None,
-                        "objective": None,
-                        "pretraining": None,
-                        "finetuning": None,
-                    },
-                    "evaluation": {"tasks": [], "benchmarks": [], "headline_results": []},
-                    "open_source": {"code_url": None, "weights_url": None, "license": None},
-                    "tags": {
-                        "paper_type": [],
-                        "backbone": [],
-                        "objective": [],
-                        "tokenization": [],
-                        "topology": [],
-                    },
-                    "limitations": ["unknown", "summary_json_error"],
-                    "used_fulltext": used_fulltext,
-                    "notes": f"{merged_notes};summary_json_error",
-                },
-                {"repair_used": True},
-            )
+
+    # deterministic fallback with schema-compatible defaults
+    return (
+        {
+            **identity,
+            **copy.deepcopy(_FALLBACK_SUMMARY_TEMPLATE),
+            "used_fulltext": used_fulltext,
+            "notes": f"{merged_notes};summary_json_error",
+        },
+        {"repair_used": True, "error": error},
+    )
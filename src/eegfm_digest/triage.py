@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
-from jsonschema import ValidationError, validate
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
+from . import jsonio
 from .llm import LLMCaller, parse_json_text
 
 
@@ -13,15 +15,40 @@ class SchemaValidationError(RuntimeError):
     pass
 
 
-def load_schema(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+class LoadedSchema(dict):
+    """Schema dict with its checked validator and prompt JSON built once at load time."""
+
+    def __init__(self, schema: dict[str, Any]):
+        super().__init__(schema)
+        cls = validator_for(self)
+        cls.check_schema(self)
+        self.validator: Validator = cls(self)
+        self.prompt_json = jsonio.dumps_str(self)
+
+
+def load_schema(path: Path) -> LoadedSchema:
+    return LoadedSchema(jsonio.loads(path.read_bytes()))
+
+
+def schema_prompt_json(schema: dict[str, Any]) -> str:
+    if isinstance(schema, LoadedSchema):
+        return schema.prompt_json
+    return jsonio.dumps_str(schema)
+
+
+def _schema_validator(schema: dict[str, Any]) -> Validator:
+    if isinstance(schema, LoadedSchema):
+        return schema.validator
+    # Ad-hoc schemas (not from load_schema) are checked on every call, like jsonschema.validate.
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
 
 
 def validate_json(data: dict[str, Any], schema: dict[str, Any]) -> None:
-    try:
-        validate(data, schema)
-    except ValidationError as exc:
-        raise SchemaValidationError(str(exc)) from exc
+    error = best_match(_schema_validator(schema).iter_errors(data))
+    if error is not None:
+        raise SchemaValidationError(str(error)) from error
 
 
 def _persisted_triage(arxiv_id_base: str, data: dict[str, Any]) -> dict[str, Any]:
@@ -67,7 +94,7 @@ def triage_paper_with_meta(
         return _persisted_triage(paper["arxiv_id_base"], data), {"repair_used": False}
     except Exception:
         repair_prompt = (
-            repair_template.replace("{{SCHEMA_JSON}}", json.dumps(schema, ensure_ascii=False))
+            repair_template.replace("{{SCHEMA_JSON}}", schema_prompt_json(schema))
             .replace("{{BAD_OUTPUT}}", raw)
         )
         try:
@@ -75,7 +102,7 @@ def triage_paper_with_meta(
             data = parse_json_text(repaired)
             validate_json(data, schema)
             return _persisted_triage(paper["arxiv_id_base"], data), {"repair_used": True}
-        except Exception:
+        except Exception as exc:
             return (
                 {
                     "arxiv_id_base": paper["arxiv_id_base"],
@@ -83,5 +110,5 @@ def triage_paper_with_meta(
                     "confidence": 0.0,
                     "reasons": ["triage_json_error", "insufficient_valid_output"],
                 },
-                {"repair_used": True},
+                {"repair_used": True, "error": f"{type(exc).__name__}: {exc}"},
             )
@@ -1,4 +1,39 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+# Headless-only launch flags: skip GPU init, extensions and first-run work, and keep
+# Chromium off the small /dev/shm found on CI runners.
+_CHROMIUM_ARGS = (
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--no-first-run",
+    "--no-default-browser-check",
+)
+
+
+@pytest.fixture(scope="session")
+def summary_schema() -> dict:
+    from eegfm_digest.triage import load_schema
+
+    return load_schema(Path("schemas/summary.json"))
+
+
+# Shared by the E2E modules; module scope keeps one browser per test file.
+@pytest.fixture(scope="module")
+def browser():
+    playwright_sync_api = pytest.importorskip("playwright.sync_api")
+    with playwright_sync_api.sync_playwright() as p:
+        try:
+            browser = p.chromium.launch(headless=True, args=list(_CHROMIUM_ARGS))
+        except Exception as exc:  # pragma: no cover - environment dependent
+            pytest.skip(f"Playwright browser unavailable: {exc}")
+        try:
+            yield browser
+        finally:
+            browser.close()
@@ -1,4 +1,14 @@
-from eegfm_digest.llm import LLMCallConfig, OpenAICall, load_api_key, parse_json_text
+import pytest
+
+from eegfm_digest.llm import (
+    CachedLLMCall,
+    LLMCallConfig,
+    LLMCallResult,
+    LLMResponseCache,
+    OpenAICall,
+    load_api_key,
+    parse_json_text,
+)
 
 
 def _fake_response(text: str):
@@ -123,3 +133,63 @@ def test_parse_json_text_extracts_json_object_from_surrounding_text():
         "confidence": 0.9,
         "reasons": ["r1", "r2"],
     }
+
+
+def test_cached_llm_call_replays_identical_requests(tmp_path):
+    class CountingLLM:
+        def __init__(self):
+            self.calls = 0
+
+        def call(self, prompt, schema=None):  # noqa: ANN001
+            self.calls += 1
+            return LLMCallResult(text=f'{{"n": {self.calls}}}', provider="google", model="m")
+
+        def close(self):  # noqa: ANN201
+            return None
+
+    config = LLMCallConfig(provider="google", api_key="k", model="m", temperature=0.2, max_output_tokens=64)
+    schema = {"type": "object"}
+    cache = LLMResponseCache(tmp_path / "llm_responses.sqlite")
+    inner = CountingLLM()
+    llm = CachedLLMCall(inner, config, cache)
+
+    assert llm.call("prompt", schema=schema).text == '{"n": 1}'
+    assert llm.call("prompt", schema=schema).text == '{"n": 1}'
+    assert llm.call("other prompt", schema=schema).text == '{"n": 2}'
+    assert inner.calls == 2
+
+    forced = CachedLLMCall(inner, config, cache, read=False)
+    assert forced.call("prompt", schema=schema).text == '{"n": 3}'
+    assert llm.call("prompt", schema=schema).text == '{"n": 3}'
+    cache.close()
+
+
+def test_cached_llm_call_stores_stage_responses_only_when_kept(tmp_path):
+    class CountingLLM:
+        def __init__(self):
+            self.calls = 0
+
+        def call(self, prompt, schema=None):  # noqa: ANN001
+            self.calls += 1
+            return LLMCallResult(text=f"response-{self.calls}", provider="google", model="m")
+
+    config = LLMCallConfig(provider="google", api_key="k", model="m", temperature=0.2, max_output_tokens=64)
+    cache = LLMResponseCache(tmp_path / "llm_responses.sqlite")
+    inner = CountingLLM()
+    llm = CachedLLMCall(inner, config, cache)
+
+    with llm.stage() as stage:
+        assert llm.call("prompt").text == "response-1"
+        stage.discard()
+    with llm.stage():
+        assert llm.call("prompt").text == "response-2"
+        assert llm.call("repair prompt").text == "response-3"
+    assert llm.call("prompt").text == "response-2"
+    assert llm.call("repair prompt").text == "response-3"
+    assert inner.calls == 3
+
+    with pytest.raises(RuntimeError), llm.stage():
+        llm.call("other prompt")
+        raise RuntimeError("stage failed")
+    assert llm.call("other prompt").text == "response-5"
+    cache.close()
@@ -1,10 +1,13 @@
 import hashlib
 import json
+import re
 import sqlite3
+import threading
 from pathlib import Path
 
 import pytest
 
+from eegfm_digest import jsonio
 from eegfm_digest.config import Config
 from eegfm_digest.llm import LLMRateLimitError
 from eegfm_digest.pipeline import run_month
@@ -28,9 +31,28 @@ def _candidate(arxiv_id_base: str, published: str, title: str) -> dict:
     }
 
 
+# Non-blank lines in one pass; whitespace-only lines never match.
+_JSONL_LINE_RE = re.compile(rb"[^\r\n]*\S[^\r\n]*")
+
+
 def _read_jsonl(path: Path) -> list[dict]:
-    lines = [line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
-    return [json.loads(line) for line in lines]
+    return [jsonio.loads(match.group()) for match in _JSONL_LINE_RE.finditer(path.read_bytes())]
+
+
+class _DummyLLMCall:
+    def close(self):  # noqa: ANN201
+        return None
+
+
+def _patch_pipeline(monkeypatch, candidates: list[dict]) -> None:  # noqa: ANN001
+    # arXiv fetch, API key and LLM client stubs shared by every run_month test.
+    patches = {
+        "fetch_month_candidates": lambda *_args, **_kwargs: candidates,
+        "load_api_key": lambda *_args, **_kwargs: "test-key",
+        "build_llm_call": lambda *_args, **_kwargs: _DummyLLMCall(),
+    }
+    for name, value in patches.items():
+        monkeypatch.setattr(f"eegfm_digest.pipeline.{name}", value)
 
 
 def test_pipeline_writes_backend_rows_and_skips_site(monkeypatch, tmp_path):
@@ -39,14 +61,7 @@ def test_pipeline_writes_backend_rows_and_skips_site(monkeypatch, tmp_path):
         _candidate("2501.00001", "2025-01-02T00:00:00Z", "Accepted Paper"),
     ]
 
-    monkeypatch.setattr("eegfm_digest.pipeline.fetch_month_candidates", lambda *_args, **_kwargs: candidates)
-    monkeypatch.setattr("eegfm_digest.pipeline.load_api_key", lambda *_args, **_kwargs: "test-key")
-
-    class DummyLMCall:
-        def close(self):  # noqa: ANN201
-            return None
-
-    monkeypatch.setattr("eegfm_digest.pipeline.build_llm_call", lambda *_args, **_kwargs: DummyLMCall())
+    _patch_pipeline(monkeypatch, candidates)
 
     def fake_triage_paper(paper, *_args, **_kwargs):  # noqa: ANN001
         decision = "accept" if paper["arxiv_id_base"] == "2501.00001" else "reject"
@@ -170,14 +185,7 @@ def test_pipeline_writes_backend_rows_and_skips_site(monkeypatch, tmp_path):
 def test_pipeline_writes_explicit_featured_paper_to_digest(monkeypatch, tmp_path):
     candidates = [_candidate("2501.00001", "2025-01-02T00:00:00Z", "Accepted Paper")]
 
-    monkeypatch.setattr("eegfm_digest.pipeline.fetch_month_candidates", lambda *_args, **_kwargs: candidates)
-    monkeypatch.setattr("eegfm_digest.pipeline.load_api_key", lambda *_args, **_kwargs: "test-key")
-
-    class DummyLMCall:
-        def close(self):  # noqa: ANN201
-            return None
-
-    monkeypatch.setattr("eegfm_digest.pipeline.build_llm_call", lambda *_args, **_kwargs: DummyLMCall())
+    _patch_pipeline(monkeypatch, candidates)
     monkeypatch.setattr(
         "eegfm_digest.pipeline.triage_paper",
         lambda paper, *_args, **_kwargs: {
@@ -246,14 +254,7 @@ def test_pipeline_site_outputs_manifest_month_revision(monkeypatch, tmp_path):
         _candidate("2501.00001", "2025-01-02T00:00:00Z", "Accepted Paper"),
     ]
 
-    monkeypatch.setattr("eegfm_digest.pipeline.fetch_month_candidates", lambda *_args, **_kwargs: candidates)
-    monkeypatch.setattr("eegfm_digest.pipeline.load_api_key", lambda *_args, **_kwargs: "test-key")
-
-    class DummyLMCall:
-        def close(self):  # noqa: ANN201
-            return None
-
-    monkeypatch.setattr("eegfm_digest.pipeline.build_llm_call", lambda *_args, **_kwargs: DummyLMCall())
+    _patch_pipeline(monkeypatch, candidates)
 
     monkeypatch.setattr(
         "eegfm_digest.pipeline.triage_paper",
@@ -345,7 +346,7 @@ def test_pipeline_site_outputs_manifest_month_revision(monkeypatch, tmp_path):
     month_payload_path = cfg.docs_dir / "digest" / "2025-01" / "papers.json"
     manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
     month_row = manifest["months"][0]
-    expected_rev = hashlib.sha256(month_payload_path.read_bytes()).hexdigest()[:16]
+    expected_rev = hashlib.blake2b(month_payload_path.read_bytes(), digest_size=8).hexdigest()
 
     assert manifest["latest"] == "2025-01"
     assert month_row["month"] == "2025-01"
@@ -359,14 +360,7 @@ def test_pipeline_preserves_summary_when_triage_flips_to_reject(monkeypatch, tmp
     candidate = _candidate("2501.00001", "2025-01-02T00:00:00Z", "Flip Paper")
     candidates = [candidate]
 
-    monkeypatch.setattr("eegfm_digest.pipeline.fetch_month_candidates", lambda *_args, **_kwargs: candidates)
-    monkeypatch.setattr("eegfm_digest.pipeline.load_api_key", lambda *_args, **_kwargs: "test-key")
-
-    class DummyLMCall:
-        def close(self):  # noqa: ANN201
-            return None
-
-    monkeypatch.setattr("eegfm_digest.pipeline.build_llm_call", lambda *_args, **_kwargs: DummyLMCall())
+    _patch_pipeline(monkeypatch, candidates)
 
     triage_state = {"decision": "accept"}
 
@@ -479,14 +473,7 @@ def test_pipeline_preserves_summary_when_triage_flips_to_reject(monkeypatch, tmp
 def test_pipeline_reraises_llm_rate_limit_errors(monkeypatch, tmp_path):
     candidates = [_candidate("2501.00001", "2025-01-02T00:00:00Z", "Accepted Paper")]
 
-    monkeypatch.setattr("eegfm_digest.pipeline.fetch_month_candidates", lambda *_args, **_kwargs: candidates)
-    monkeypatch.setattr("eegfm_digest.pipeline.load_api_key", lambda *_args, **_kwargs: "test-key")
-
-    class DummyLMCall:
-        def close(self):  # noqa: ANN201
-            return None
-
-    monkeypatch.setattr("eegfm_digest.pipeline.build_llm_call", lambda *_args, **_kwargs: DummyLMCall())
+    _patch_pipeline(monkeypatch, candidates)
     monkeypatch.setattr(
         "eegfm_digest.pipeline.triage_paper",
         lambda *_args, **_kwargs: (_ for _ in ()).throw(LLMRateLimitError("429 upstream")),
@@ -511,14 +498,7 @@ def test_pipeline_reraises_llm_rate_limit_errors(monkeypatch, tmp_path):
 def test_pipeline_pdf_download_failure_bumps_summary_failures(monkeypatch, tmp_path):
     candidates = [_candidate("2501.00001", "2025-01-02T00:00:00Z", "Accepted Paper")]
 
-    monkeypatch.setattr("eegfm_digest.pipeline.fetch_month_candidates", lambda *_args, **_kwargs: candidates)
-    monkeypatch.setattr("eegfm_digest.pipeline.load_api_key", lambda *_args, **_kwargs: "test-key")
-
-    class DummyLMCall:
-        def close(self):  # noqa: ANN201
-            return None
-
-    monkeypatch.setattr("eegfm_digest.pipeline.build_llm_call", lambda *_args, **_kwargs: DummyLMCall())
+    _patch_pipeline(monkeypatch, candidates)
     monkeypatch.setattr(
         "eegfm_digest.pipeline.triage_paper",
         lambda paper, *_a, **_k: {
@@ -568,14 +548,7 @@ def test_pipeline_missing_pdf_link_bumps_summary_failures(monkeypatch, tmp_path)
     paper["links"]["pdf"] = ""  # accepted paper, no pdf URL
     candidates = [paper]
 
-    monkeypatch.setattr("eegfm_digest.pipeline.fetch_month_candidates", lambda *_args, **_kwargs: candidates)
-    monkeypatch.setattr("eegfm_digest.pipeline.load_api_key", lambda *_args, **_kwargs: "test-key")
-
-    class DummyLMCall:
-        def close(self):  # noqa: ANN201
-            return None
-
-    monkeypatch.setattr("eegfm_digest.pipeline.build_llm_call", lambda *_args, **_kwargs: DummyLMCall())
+    _patch_pipeline(monkeypatch, candidates)
     monkeypatch.setattr(
         "eegfm_digest.pipeline.triage_paper",
         lambda p, *_a, **_k: {
@@ -604,3 +577,256 @@ def test_pipeline_missing_pdf_link_bumps_summary_failures(monkeypatch, tmp_path)
     assert stats.summary_failures == 1
     assert stats.summarized == 0
     assert stats.accepted == 1
+
+
+def test_pipeline_overlaps_triage_calls_when_concurrency_configured(monkeypatch, tmp_path):
+    candidates = [
+        _candidate("2501.00002", "2025-01-03T00:00:00Z", "Second Paper"),
+        _candidate("2501.00001", "2025-01-02T00:00:00Z", "First Paper"),
+    ]
+
+    _patch_pipeline(monkeypatch, candidates)
+
+    # Both calls must be in flight at once to get past the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_triage_paper(paper, *_args, **_kwargs):  # noqa: ANN001
+        barrier.wait()
+        return {
+            "arxiv_id_base": paper["arxiv_id_base"],
+            "decision": "reject",
+            "confidence": 0.1,
+            "reasons": ["r1", "r2"],
+        }
+
+    monkeypatch.setattr("eegfm_digest.pipeline.triage_paper", fake_triage_paper)
+
+    cfg = Config(
+        llm_model_triage="triage-model",
+        llm_model_summary="summary-model",
+        output_dir=tmp_path / "outputs",
+        data_dir=tmp_path / "data",
+        docs_dir=tmp_path / "docs",
+        max_candidates=20,
+        max_accepted=20,
+        arxiv_rate_limit_seconds=0.0,
+        pdf_rate_limit_seconds=0.0,
+        llm_concurrency=2,
+    )
+
+    stats = run_month(cfg, "2025-01", no_site=True)
+
+    triage_rows = _read_jsonl(cfg.output_dir / "2025-01" / "triage.jsonl")
+    assert [row["arxiv_id_base"] for row in triage_rows] == ["2501.00001", "2501.00002"]
+    assert stats.triage_failures == 0
+
+
+def test_pipeline_interleaves_pdf_downloads_with_summary_calls(monkeypatch, tmp_path):
+    candidates = [
+        _candidate("2501.00002", "2025-01-03T00:00:00Z", "Second Paper"),
+        _candidate("2501.00001", "2025-01-02T00:00:00Z", "First Paper"),
+    ]
+
+    _patch_pipeline(monkeypatch, candidates)
+    monkeypatch.setattr(
+        "eegfm_digest.pipeline.triage_paper",
+        lambda paper, *_args, **_kwargs: {
+            "arxiv_id_base": paper["arxiv_id_base"],
+            "decision": "accept",
+            "confidence": 0.9,
+            "reasons": ["r1", "r2"],
+        },
+    )
+
+    events: list[str] = []
+
+    def fake_download_pdf(_url, out_path, _rate):  # noqa: ANN001
+        events.append(f"download:{out_path.stem}")
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_bytes(b"%PDF-1.4")
+        return out_path
+
+    def fake_extract_text(_pdf_path, text_path):  # noqa: ANN001
+        text_path.parent.mkdir(parents=True, exist_ok=True)
+        text_path.write_text("Abstract\nEEG abstract", encoding="utf-8")
+        return {"tool": "pypdf", "pages": 1, "chars": 20, "error": None}
+
+    def fake_summarize_paper(paper, *_args, **_kwargs):  # noqa: ANN001
+        events.append(f"summary:{paper['arxiv_id_base']}")
+        raise LLMRateLimitError("429 upstream")
+
+    monkeypatch.setattr("eegfm_digest.pipeline.download_pdf", fake_download_pdf)
+    monkeypatch.setattr("eegfm_digest.pipeline.extract_text", fake_extract_text)
+    monkeypatch.setattr("eegfm_digest.pipeline.summarize_paper", fake_summarize_paper)
+
+    cfg = Config(
+        llm_model_triage="triage-model",
+        llm_model_summary="summary-model",
+        output_dir=tmp_path / "outputs",
+        data_dir=tmp_path / "data",
+        docs_dir=tmp_path / "docs",
+        max_candidates=20,
+        max_accepted=20,
+        arxiv_rate_limit_seconds=0.0,
+        pdf_rate_limit_seconds=0.0,
+    )
+
+    with pytest.raises(LLMRateLimitError):
+        run_month(cfg, "2025-01", no_site=True)
+
+    # A provider failure surfaces on the first summary call, before the next PDF is fetched.
+    assert events == ["download:2501.00001", "summary:2501.00001"]
+
+
+def test_pipeline_warns_with_error_when_summary_falls_back(monkeypatch, tmp_path, capsys):
+    candidates = [_candidate("2501.00001", "2025-01-02T00:00:00Z", "Accepted Paper")]
+
+    _patch_pipeline(monkeypatch, candidates)
+
+    class BadJSONLLMCall(_DummyLLMCall):
+        def call(self, prompt, schema=None):  # noqa: ANN001
+            return type("FakeCallResult", (), {"text": "{not json"})()
+
+        def count_tokens(self, content: str) -> int:
+            return 1
+
+    monkeypatch.setattr(
+        "eegfm_digest.pipeline.build_llm_call", lambda *_args, **_kwargs: BadJSONLLMCall()
+    )
+    monkeypatch.setattr(
+        "eegfm_digest.pipeline.triage_paper",
+        lambda paper, *_args, **_kwargs: {
+            "arxiv_id_base": paper["arxiv_id_base"],
+            "decision": "accept",
+            "confidence": 0.9,
+            "reasons": ["r1", "r2"],
+        },
+    )
+
+    def fake_download_pdf(_url, out_path, _rate):  # noqa: ANN001
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_bytes(b"%PDF-1.4")
+        return out_path
+
+    def fake_extract_text(_pdf_path, text_path):  # noqa: ANN001
+        text_path.parent.mkdir(parents=True, exist_ok=True)
+        text_path.write_text("Abstract\nEEG abstract", encoding="utf-8")
+        return {"tool": "pypdf", "pages": 1, "chars": 20, "error": None}
+
+    monkeypatch.setattr("eegfm_digest.pipeline.download_pdf", fake_download_pdf)
+    monkeypatch.setattr("eegfm_digest.pipeline.extract_text", fake_extract_text)
+
+    cfg = Config(
+        llm_model_triage="triage-model",
+        llm_model_summary="summary-model",
+        output_dir=tmp_path / "outputs",
+        data_dir=tmp_path / "data",
+        docs_dir=tmp_path / "docs",
+        max_candidates=20,
+        max_accepted=20,
+        arxiv_rate_limit_seconds=0.0,
+        pdf_rate_limit_seconds=0.0,
+        llm_response_cache=True,
+    )
+
+    run_month(cfg, "2025-01", no_site=True)
+
+    err = capsys.readouterr().err
+    assert "summary fell back to defaults for 2501.00001: JSONDecodeError" in err
+    # The failed stage's responses are not kept for replay.
+    with sqlite3.connect(cfg.data_dir / "llm_responses.sqlite") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0] == 0
+
+
+def test_pipeline_response_cache_keeps_summaries_that_needed_normalization(monkeypatch, tmp_path):
+    candidates = [_candidate("2501.00001", "2025-01-02T00:00:00Z", "Accepted Paper")]
+
+    _patch_pipeline(monkeypatch, candidates)
+
+    triage_json = json.dumps({"decision": "accept", "confidence": 0.9, "reasons": ["r1", "r2"]})
+    # Raw output that only validates after normalization: tag alias, numeric strings,
+    # list paper_type and too many key points.
+    summary_json = json.dumps(
+        {
+            "paper_type": ["eeg-fm"],
+            "one_liner": "Concise summary line.",
+            "detailed_summary": (
+                "This work proposes a concise EEG modeling approach with explicit transfer framing "
+                "and reports benchmark gains using pretrained representations. "
+                "Its novel contribution is a deterministic pipeline that isolates method effects."
+            ),
+            "unique_contribution": "Deterministic contribution sentence.",
+            "key_points": ["point one", "point two", "point three", "point four"],
+            "data_scale": {
+                "datasets": ["Dataset-A"],
+                "subjects": "10k+",
+                "eeg_hours": "2,000",
+                "channels": "64",
+            },
+            "method": {
+                "architecture": "Transformer",
+                "objective": "Masked prediction",
+                "pretraining": "Self-supervised",
+                "finetuning": "Linear probe",
+            },
+            "evaluation": {
+                "tasks": ["classification"],
+                "benchmarks": ["Benchmark-A"],
+                "headline_results": ["AUROC"],
+            },
+            "open_source": {"code_url": None, "weights_url": None, "license": None},
+            "tags": {
+                "paper_type": ["eeg-fm"],
+                "backbone": ["transformer"],
+                "objective": ["masked-reconstruction"],
+                "tokenization": ["time-patch"],
+                "topology": ["fixed-montage"],
+            },
+            "limitations": ["limited cohorts", "single dataset"],
+        }
+    )
+
+    class StageLLMCall(_DummyLLMCall):
+        def call(self, prompt, schema=None):  # noqa: ANN001
+            text = triage_json if "decision" in schema["properties"] else summary_json
+            return type("FakeCallResult", (), {"text": text})()
+
+        def count_tokens(self, content: str) -> int:
+            return 1
+
+    monkeypatch.setattr(
+        "eegfm_digest.pipeline.build_llm_call", lambda *_args, **_kwargs: StageLLMCall()
+    )
+
+    def fake_download_pdf(_url, out_path, _rate):  # noqa: ANN001
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_bytes(b"%PDF-1.4")
+        return out_path
+
+    def fake_extract_text(_pdf_path, text_path):  # noqa: ANN001
+        text_path.parent.mkdir(parents=True, exist_ok=True)
+        text_path.write_text("Abstract\nEEG abstract", encoding="utf-8")
+        return {"tool": "pypdf", "pages": 1, "chars": 20, "error": None}
+
+    monkeypatch.setattr("eegfm_digest.pipeline.download_pdf", fake_download_pdf)
+    monkeypatch.setattr("eegfm_digest.pipeline.extract_text", fake_extract_text)
+
+    cfg = Config(
+        llm_model_triage="triage-model",
+        llm_model_summary="summary-model",
+        output_dir=tmp_path / "outputs",
+        data_dir=tmp_path / "data",
+        docs_dir=tmp_path / "docs",
+        max_candidates=20,
+        max_accepted=20,
+        arxiv_rate_limit_seconds=0.0,
+        pdf_rate_limit_seconds=0.0,
+        llm_response_cache=True,
+    )
+
+    stats = run_month(cfg, "2025-01", no_site=True)
+
+    assert stats.summarized == 1
+    with sqlite3.connect(cfg.data_dir / "llm_responses.sqlite") as conn:
+        stored = {row[0] for row in conn.execute("SELECT response_text FROM llm_responses")}
+    assert stored == {triage_json, summary_json}
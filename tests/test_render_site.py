@@ -1,7 +1,9 @@
 import hashlib
 import json
+import os
 from pathlib import Path
 
+from eegfm_digest import site
 from eegfm_digest.site import render_month_page, update_home, write_month_site
 
 
@@ -258,7 +260,7 @@ def test_update_home_month_revision_matches_payload_hash(tmp_path):
     update_home(docs_dir)
     manifest = json.loads((docs_dir / "data" / "months.json").read_text(encoding="utf-8"))
     row = manifest["months"][0]
-    expected = hashlib.sha256(payload_path.read_bytes()).hexdigest()[:16]
+    expected = hashlib.blake2b(payload_path.read_bytes(), digest_size=8).hexdigest()
     assert row["month"] == "2025-01"
     assert row["month_rev"] == expected
 
@@ -273,3 +275,39 @@ def test_update_home_month_revision_missing_when_papers_missing(tmp_path):
     row = manifest["months"][0]
     assert row["month"] == "2025-01"
     assert row["month_rev"] == "missing"
+
+
+def test_update_home_reuses_manifest_row_for_unchanged_settled_payload(tmp_path, monkeypatch):
+    docs_dir = tmp_path / "docs"
+    month_dir = docs_dir / "digest" / "2025-01"
+    month_dir.mkdir(parents=True, exist_ok=True)
+    payload_path = month_dir / "papers.json"
+    payload = {
+        "month": "2025-01",
+        "featured_paper_id": None,
+        "stats": {"candidates": 1, "accepted": 1, "summarized": 1},
+        "papers": [{"arxiv_id_base": "2501.00001", "summary": {"title": "x"}}],
+        "top_picks": ["2501.00001"],
+    }
+    payload_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    os.utime(payload_path, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+
+    update_home(docs_dir)
+    months_path = docs_dir / "data" / "months.json"
+    first = months_path.read_bytes()
+
+    def fail_loads(_raw):  # noqa: ANN001
+        raise AssertionError("unchanged payload should not be re-parsed")
+
+    monkeypatch.setattr(site.jsonio, "loads", fail_loads)
+    update_home(docs_dir)
+    assert months_path.read_bytes() == first
+
+    monkeypatch.undo()
+    payload["stats"]["candidates"] = 2
+    payload_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    update_home(docs_dir)
+    row = json.loads(months_path.read_text(encoding="utf-8"))["months"][0]
+    assert row["stats"]["candidates"] == 2
+    expected = hashlib.blake2b(payload_path.read_bytes(), digest_size=8).hexdigest()
+    assert row["month_rev"] == expected
@@ -1,8 +1,23 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from eegfm_digest.summarize import summarize_paper
-from eegfm_digest.triage import load_schema, triage_paper
+from eegfm_digest.triage import (
+    SchemaValidationError,
+    _schema_validator,
+    load_schema,
+    schema_prompt_json,
+    triage_paper,
+    validate_json,
+)
+
+_TRIAGE_PROMPT = Path("prompts/triage.md").read_text()
+_SUMMARIZE_PROMPT = Path("prompts/summarize.md").read_text()
+_REPAIR_PROMPT = Path("prompts/repair_json.md").read_text()
+_TRIAGE_SCHEMA = load_schema(Path("schemas/triage.json"))
+_SUMMARY_SCHEMA = load_schema(Path("schemas/summary.json"))
 
 
 class FakeCallResult:
@@ -39,7 +54,6 @@ def _summary_slices() -> dict[str, str]:
 
 
 def test_triage_prompt_payload_is_title_and_abstract_only():
-    triage_schema = load_schema(Path("schemas/triage.json"))
     paper = {
         "arxiv_id_base": "2501.99999",
         "title": "Title only paper",
@@ -59,8 +73,8 @@ def test_triage_prompt_payload_is_title_and_abstract_only():
         paper,
         llm,
         "Title: {{TITLE}}\n\nAbstract: {{ABSTRACT}}",
-        Path("prompts/repair_json.md").read_text(),
-        triage_schema,
+        _REPAIR_PROMPT,
+        _TRIAGE_SCHEMA,
     )
     prompt = llm.prompts[0]
     assert "Title: Title only paper" in prompt
@@ -79,7 +93,6 @@ def test_triage_prompt_payload_is_title_and_abstract_only():
 
 
 def test_triage_repair_path():
-    triage_schema = load_schema(Path("schemas/triage.json"))
     paper = {
         "arxiv_id_base": "2501.12345",
         "title": "EEG paper",
@@ -98,16 +111,15 @@ def test_triage_repair_path():
     out = triage_paper(
         paper,
         llm,
-        Path("prompts/triage.md").read_text(),
-        Path("prompts/repair_json.md").read_text(),
-        triage_schema,
+        _TRIAGE_PROMPT,
+        _REPAIR_PROMPT,
+        _TRIAGE_SCHEMA,
     )
     assert out["decision"] == "accept"
     assert out["arxiv_id_base"] == "2501.12345"
 
 
 def test_summary_fallback_path():
-    schema = load_schema(Path("schemas/summary.json"))
     paper = {
         "arxiv_id_base": "2501.12345",
         "title": "EEG FM",
@@ -125,11 +137,20 @@ def test_summary_fallback_path():
         used_fulltext=False,
         notes="abstract_only",
         llm=llm,
-        prompt_template=Path("prompts/summarize.md").read_text(),
-        repair_template=Path("prompts/repair_json.md").read_text(),
-        schema=schema,
+        prompt_template=_SUMMARIZE_PROMPT,
+        repair_template=_REPAIR_PROMPT,
+        schema=_SUMMARY_SCHEMA,
         max_input_tokens=1,
     )
     assert out["arxiv_id_base"] == "2501.12345"
     assert out["used_fulltext"] is False
     assert "summary_json_error" in out["notes"]
+
+
+def test_validate_json_reuses_checked_validator_per_schema():
+    assert _schema_validator(_TRIAGE_SCHEMA) is _schema_validator(_TRIAGE_SCHEMA)
+    assert schema_prompt_json(_TRIAGE_SCHEMA) is schema_prompt_json(_TRIAGE_SCHEMA)
+    assert json.loads(schema_prompt_json(_TRIAGE_SCHEMA)) == _TRIAGE_SCHEMA
+    validate_json({"decision": "accept", "confidence": 0.9, "reasons": ["a", "b"]}, _TRIAGE_SCHEMA)
+    with pytest.raises(SchemaValidationError, match="decision"):
+        validate_json({"confidence": 0.9, "reasons": ["a", "b"]}, _TRIAGE_SCHEMA)
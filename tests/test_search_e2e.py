@@ -1,28 +1,79 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import re
 import threading
-import time
+from contextlib import contextmanager
 from functools import partial
-from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import pytest
 
-playwright_sync_api = pytest.importorskip("playwright.sync_api")
-sync_playwright = playwright_sync_api.sync_playwright
+from eegfm_digest import jsonio
+
+pytestmark = pytest.mark.e2e
 
 
 MONTH_REQ_RE = re.compile(r"/digest/\d{4}-\d{2}/papers\.json(?:\?|$)")
 MONTH_CACHE_PREFIX = "eegfm:monthPayload"
 MONTH_CACHE_SCHEMA_VERSION = "v1"
-
-
-def _write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+_SITE_JS_BYTES = (Path(__file__).resolve().parent.parent / "docs" / "assets" / "site.js").read_bytes()
+_RESET_ALL = ("clearMemCacheForTest", "clearPersistentCacheForTest", "resetCacheStatsForTest")
+_RESET_MEM = ("clearMemCacheForTest", "resetCacheStatsForTest")
+# setupDigestApp publishes __digestAppState and renders in the same task; the home
+# view only renders, so its results section filling up is the signal there.
+_APP_READY_JS = (
+    "() => window.__digestAppState !== undefined"
+    " || document.getElementById('home-results')?.childElementCount > 0"
+)
+_CARD_COUNT_JS = "(count) => document.querySelectorAll('.paper-card').length === count"
+_NETWORK_HITS_2_JS = "() => window.__digestTestHooks.getCacheStats().cumulative.network_hits >= 2"
+_LOCAL_HITS_2_JS = "() => window.__digestTestHooks.getCacheStats().cumulative.local_hits >= 2"
+_RUN_CACHE_STEPS_JS = """async (steps) => {
+  const hooks = window.__digestTestHooks;
+  for (const step of steps) {
+    if (typeof step === "string") {
+      hooks[step]();
+    } else if (step.seedStore) {
+      const target = step.seedStore === "local" ? window.localStorage : window.sessionStorage;
+      const payload = await fetch(step.payloadUrl, { cache: "no-store" }).then((r) => r.json());
+      target.setItem(step.key, JSON.stringify(payload));
+    } else {
+      await hooks.loadMonthPayloadForTest(step);
+    }
+  }
+  return hooks.getCacheStats();
+}"""
+_STORAGE_BATCH_JS = """(ops) => ops.map(([op, ...args]) => {
+  if (op === "call") {
+    window.__digestTestHooks[args[0]]();
+    return null;
+  }
+  const [store, key, value] = args;
+  const target = store === "local" ? window.localStorage : window.sessionStorage;
+  if (op === "set") {
+    target.setItem(key, value);
+    return null;
+  }
+  const raw = target.getItem(key);
+  if (op === "getMonth") {
+    return raw === null ? null : JSON.parse(raw).month;
+  }
+  return raw;
+})"""
+_SNAPSHOT_JS = """() => ({
+  meta: document.querySelector("[data-testid='results-meta']")?.innerText ?? null,
+  cards: document.querySelectorAll(".paper-card").length,
+  stats: window.__digestTestHooks.getCacheStats(),
+})"""
+_HTML_TYPE = "text/html; charset=utf-8"
+_JSON_TYPE = "application/json"
+
+
+def _json_bytes(payload: dict) -> bytes:
+    return jsonio.dumps(payload, indent=True, sort_keys=True) + b"\n"
 
 
 def _paper(
@@ -70,16 +121,10 @@ def _paper(
 
 
 def _build_synthetic_docs(
-    root: Path,
     *,
     include_missing_month: bool = False,
     null_featured_month: str | None = None,
-) -> None:
-    asset_src = Path("docs/assets/site.js")
-    asset_dst = root / "assets" / "site.js"
-    asset_dst.parent.mkdir(parents=True, exist_ok=True)
-    asset_dst.write_text(asset_src.read_text(encoding="utf-8"), encoding="utf-8")
-
+) -> dict[str, tuple[bytes, str]]:
     month_a = "2025-01"
     month_b = "2025-02"
 
@@ -142,11 +187,11 @@ def _build_synthetic_docs(
         ],
     }
 
-    _write_json(root / "digest" / month_a / "papers.json", payload_a)
-    _write_json(root / "digest" / month_b / "papers.json", payload_b)
+    bytes_a = _json_bytes(payload_a)
+    bytes_b = _json_bytes(payload_b)
 
-    rev_a = hashlib.sha256((root / "digest" / month_a / "papers.json").read_bytes()).hexdigest()[:16]
-    rev_b = hashlib.sha256((root / "digest" / month_b / "papers.json").read_bytes()).hexdigest()[:16]
+    rev_a = hashlib.blake2b(bytes_a, digest_size=8, usedforsecurity=False).hexdigest()
+    rev_b = hashlib.blake2b(bytes_b, digest_size=8, usedforsecurity=False).hexdigest()
     month_rows = [
         {
             "month": month_b,
@@ -211,72 +256,87 @@ def _build_synthetic_docs(
         "latest": latest_month,
         "months": month_rows,
     }
-    _write_json(root / "data" / "months.json", months_manifest)
-
-    fallback_months_json = json.dumps(fallback_months, ensure_ascii=False)
-    (root / "index.html").write_text(
-        (
-            "<!doctype html><html><body>"
-            f"<main id='digest-app' class='container' data-view='home' data-month='' data-manifest-json='data/months.json' "
-            f"data-fallback-months='{fallback_months_json}'>"
-            "<section id='home-controls' class='controls'></section><section id='home-results'></section></main>"
-            "<script src='assets/site.js'></script></body></html>"
-        ),
-        encoding="utf-8",
+
+    fallback_months_json = jsonio.dumps_str(fallback_months)
+    home_html = (
+        "<!doctype html><html><body>"
+        f"<main id='digest-app' class='container' data-view='home' data-month='' data-manifest-json='data/months.json' "
+        f"data-fallback-months='{fallback_months_json}'>"
+        "<section id='home-controls' class='controls'></section><section id='home-results'></section></main>"
+        "<script src='assets/site.js'></script></body></html>"
     )
-    (root / "explore").mkdir(parents=True, exist_ok=True)
-    (root / "explore" / "index.html").write_text(
-        (
-            "<!doctype html><html><body>"
-            f"<main id='digest-app' class='container' data-view='explore' data-month='' data-manifest-json='../data/months.json' "
-            f"data-fallback-months='{fallback_months_json}'>"
-            "<h1>Search</h1><section id='controls' class='controls'></section>"
-            "<p id='results-meta' class='small'></p><section id='results'></section></main>"
-            "<script src='../assets/site.js'></script></body></html>"
-        ),
-        encoding="utf-8",
+    explore_html = (
+        "<!doctype html><html><body>"
+        f"<main id='digest-app' class='container' data-view='explore' data-month='' data-manifest-json='../data/months.json' "
+        f"data-fallback-months='{fallback_months_json}'>"
+        "<h1>Search</h1><section id='controls' class='controls'></section>"
+        "<p id='results-meta' class='small'></p><section id='results'></section></main>"
+        "<script src='../assets/site.js'></script></body></html>"
     )
-    (root / "digest" / month_a).mkdir(parents=True, exist_ok=True)
-    (root / "digest" / month_b).mkdir(parents=True, exist_ok=True)
-    (root / "digest" / month_a / "index.html").write_text(
-        (
-            "<!doctype html><html><body>"
-            f"<main id='digest-app' class='container' data-view='month' data-month='{month_a}' "
-            "data-manifest-json='../../data/months.json' data-month-json='../../digest/2025-01/papers.json'>"
-            "<section id='featured-paper'></section>"
-            "<section id='controls' class='controls'></section>"
-            "<p id='results-meta' class='small'></p><section id='results'></section></main>"
-            "<script src='../../assets/site.js'></script></body></html>"
-        ),
-        encoding="utf-8",
+    month_a_html = (
+        "<!doctype html><html><body>"
+        f"<main id='digest-app' class='container' data-view='month' data-month='{month_a}' "
+        "data-manifest-json='../../data/months.json' data-month-json='../../digest/2025-01/papers.json'>"
+        "<section id='featured-paper'></section>"
+        "<section id='controls' class='controls'></section>"
+        "<p id='results-meta' class='small'></p><section id='results'></section></main>"
+        "<script src='../../assets/site.js'></script></body></html>"
     )
-    (root / "digest" / month_b / "index.html").write_text(
-        (
-            "<!doctype html><html><body>"
-            f"<main id='digest-app' class='container' data-view='month' data-month='{month_b}' "
-            "data-manifest-json='../../data/months.json' data-month-json='../../digest/2025-02/papers.json'>"
-            "<section id='featured-paper'></section>"
-            "<section id='controls' class='controls'></section>"
-            "<p id='results-meta' class='small'></p><section id='results'></section></main>"
-            "<script src='../../assets/site.js'></script></body></html>"
-        ),
-        encoding="utf-8",
+    month_b_html = (
+        "<!doctype html><html><body>"
+        f"<main id='digest-app' class='container' data-view='month' data-month='{month_b}' "
+        "data-manifest-json='../../data/months.json' data-month-json='../../digest/2025-02/papers.json'>"
+        "<section id='featured-paper'></section>"
+        "<section id='controls' class='controls'></section>"
+        "<p id='results-meta' class='small'></p><section id='results'></section></main>"
+        "<script src='../../assets/site.js'></script></body></html>"
     )
+    return {
+        "/assets/site.js": (_SITE_JS_BYTES, "text/javascript; charset=utf-8"),
+        "/data/months.json": (_json_bytes(months_manifest), _JSON_TYPE),
+        "/index.html": (home_html.encode("utf-8"), _HTML_TYPE),
+        "/explore/index.html": (explore_html.encode("utf-8"), _HTML_TYPE),
+        f"/digest/{month_a}/index.html": (month_a_html.encode("utf-8"), _HTML_TYPE),
+        f"/digest/{month_a}/papers.json": (bytes_a, _JSON_TYPE),
+        f"/digest/{month_b}/index.html": (month_b_html.encode("utf-8"), _HTML_TYPE),
+        f"/digest/{month_b}/papers.json": (bytes_b, _JSON_TYPE),
+    }
 
 
-@pytest.fixture(scope="module")
-def synthetic_site(tmp_path_factory):
-    root = tmp_path_factory.mktemp("synthetic_docs")
-    _build_synthetic_docs(root)
-    handler = partial(SimpleHTTPRequestHandler, directory=str(root))
-    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+def _raw_response(body: bytes, content_type: str) -> bytes:
+    head = (
+        f"HTTP/1.0 200 OK\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class _InMemoryHandler(BaseHTTPRequestHandler):
+    # Writes a pre-encoded status line, headers and body per known path; anything else
+    # is a 404.
+    def __init__(self, *args, responses: dict[str, bytes], **kwargs):
+        self.responses = responses
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self) -> None:
+        response = self.responses.get(urlsplit(self.path).path)
+        if response is None:
+            self.send_error(404)
+            return
+        self.wfile.write(response)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@contextmanager
+def _serve_routes(routes: dict[str, tuple[bytes, str]]):
+    responses = {path: _raw_response(*route) for path, route in routes.items()}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_InMemoryHandler, responses=responses))
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     try:
-        yield {
-            "root": root,
-            "base_url": f"http://127.0.0.1:{server.server_port}",
-        }
+        yield {"base_url": f"http://127.0.0.1:{server.server_port}"}
     finally:
         server.shutdown()
         thread.join(timeout=2)
@@ -284,65 +344,135 @@ def synthetic_site(tmp_path_factory):
 
 
 @pytest.fixture(scope="module")
-def synthetic_site_with_missing_month(tmp_path_factory):
-    root = tmp_path_factory.mktemp("synthetic_docs_missing_month")
-    _build_synthetic_docs(root, include_missing_month=True)
-    handler = partial(SimpleHTTPRequestHandler, directory=str(root))
-    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
-    try:
-        yield {
-            "root": root,
-            "base_url": f"http://127.0.0.1:{server.server_port}",
-        }
-    finally:
-        server.shutdown()
-        thread.join(timeout=2)
-        server.server_close()
+def synthetic_site():
+    with _serve_routes(_build_synthetic_docs()) as site:
+        yield site
 
 
 @pytest.fixture(scope="module")
-def synthetic_site_with_null_featured_month(tmp_path_factory):
-    root = tmp_path_factory.mktemp("synthetic_docs_null_featured")
-    _build_synthetic_docs(root, null_featured_month="2025-01")
-    handler = partial(SimpleHTTPRequestHandler, directory=str(root))
-    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
+def synthetic_site_with_missing_month():
+    with _serve_routes(_build_synthetic_docs(include_missing_month=True)) as site:
+        yield site
+
+
+@pytest.fixture(scope="module")
+def synthetic_site_with_null_featured_month():
+    with _serve_routes(_build_synthetic_docs(null_featured_month="2025-01")) as site:
+        yield site
+
+
+@pytest.fixture(scope="module")
+def context(browser):
+    context = browser.new_context(accept_downloads=True, service_workers="block")
     try:
-        yield {
-            "root": root,
-            "base_url": f"http://127.0.0.1:{server.server_port}",
-        }
+        yield context
     finally:
-        server.shutdown()
-        thread.join(timeout=2)
-        server.server_close()
+        context.close()
+
+
+# Tests share one context per module, so each test's tab wipes the origin's localStorage
+# on its first navigation. The marker lives in sessionStorage: it is per tab, survives
+# same-tab navigation, and is not matched by the month cache's prefix-based clears.
+_FRESH_TAB_INIT_SCRIPT = """
+(() => {
+  try {
+    if (!window.sessionStorage.getItem("__e2eFreshTab")) {
+      window.localStorage.clear();
+      window.sessionStorage.setItem("__e2eFreshTab", "1");
+    }
+  } catch (_err) {
+    // Storage may be blocked by a test; nothing to reset then.
+  }
+})();
+"""
+
+# Makes every localStorage get/set/remove throw, as in browsers with storage disabled.
+_BLOCK_LOCAL_STORAGE_INIT_SCRIPT = """
+(() => {
+  const proto = Storage.prototype;
+  const originalGetItem = proto.getItem;
+  const originalSetItem = proto.setItem;
+  const originalRemoveItem = proto.removeItem;
+  proto.getItem = function(key) {
+    if (this === window.localStorage) {
+      throw new Error("local_get_blocked");
+    }
+    return originalGetItem.call(this, key);
+  };
+  proto.setItem = function(key, value) {
+    if (this === window.localStorage) {
+      throw new Error("local_set_blocked");
+    }
+    return originalSetItem.call(this, key, value);
+  };
+  proto.removeItem = function(key) {
+    if (this === window.localStorage) {
+      throw new Error("local_remove_blocked");
+    }
+    return originalRemoveItem.call(this, key);
+  };
+})();
+"""
+
+# Records whether any .paper-card is inserted from now on, however briefly it exists.
+_WATCH_PARTIAL_CARDS_JS = """() => {
+  window.__partialCardSeen = false;
+  new MutationObserver((records) => {
+    for (const record of records) {
+      for (const node of record.addedNodes) {
+        if (node.nodeType === 1 && (node.matches(".paper-card") || node.querySelector(".paper-card"))) {
+          window.__partialCardSeen = true;
+        }
+      }
+    }
+  }).observe(document.body, { childList: true, subtree: true });
+}"""
 
 
-@pytest.fixture(scope="module")
-def browser():
-    with sync_playwright() as p:
-        try:
-            browser = p.chromium.launch(headless=True)
-        except Exception as exc:  # pragma: no cover - environment dependent
-            pytest.skip(f"Playwright browser unavailable: {exc}")
-        try:
-            yield browser
-        finally:
-            browser.close()
-
-
-def _tracked_page(context):
+def _tracked_page(context, *, fresh_storage: bool = True):
+    # Only month payload requests are recorded; the substring check skips the regex for
+    # HTML, script and manifest requests.
     urls: list[str] = []
     page = context.new_page()
-    page.on("request", lambda req: urls.append(req.url))
+    if fresh_storage:
+        page.add_init_script(_FRESH_TAB_INIT_SCRIPT)
+    page.on(
+        "request",
+        lambda req: urls.append(req.url)
+        if "papers.json" in req.url and MONTH_REQ_RE.search(req.url)
+        else None,
+    )
     return page, urls
 
 
-def _month_payload_request_count(urls: list[str]) -> int:
-    return sum(1 for url in urls if MONTH_REQ_RE.search(url))
+@pytest.fixture
+def fresh_page(context):
+    page, urls = _tracked_page(context)
+    try:
+        yield page, urls
+    finally:
+        page.close()
+
+
+def _goto(page, url: str) -> None:
+    page.goto(url, wait_until="domcontentloaded")
+    page.wait_for_function(_APP_READY_JS, timeout=4000)
+
+
+def _month_request_within(page, timeout_ms: int = 500) -> bool:
+    # Settle point for "no auto-load" checks: the ready marker fires after the first
+    # render, so a deferred fetch (timer, chained promise) would only start later.
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        page.wait_for_event(
+            "request",
+            predicate=lambda req: MONTH_REQ_RE.search(req.url) is not None,
+            timeout=timeout_ms,
+        )
+    except PlaywrightTimeoutError:
+        return False
+    return True
 
 
 def _wait_for_stats(page, predicate_js: str, timeout_ms: int = 4000):
@@ -350,6 +480,11 @@ def _wait_for_stats(page, predicate_js: str, timeout_ms: int = 4000):
     return page.evaluate("() => window.__digestTestHooks.getCacheStats()")
 
 
+def _snapshot(page) -> dict:
+    # Results meta text, rendered card count and cache stats in one round-trip.
+    return page.evaluate(_SNAPSHOT_JS)
+
+
 def _cumulative(stats: dict) -> dict:
     return stats.get("cumulative", stats)
 
@@ -359,9 +494,9 @@ def _last_run(stats: dict) -> dict:
 
 
 def _goto_explore_and_run_search_to_three_cards(page, synthetic_site: dict) -> None:
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
     page.get_by_test_id("search-run-btn").click()
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 3")
+    _wait_for_cards(page, 3)
 
 
 def _synthetic_published_dates() -> tuple[str, ...]:
@@ -369,117 +504,108 @@ def _synthetic_published_dates() -> tuple[str, ...]:
     return ("2025-01-10", "2025-01-12", "2025-02-03")
 
 
+def _load_step(month_rev: str, month: str = "2025-01") -> dict:
+    return {
+        "month": month,
+        "jsonPath": f"/digest/{month}/papers.json",
+        "view": "month",
+        "monthRev": month_rev,
+    }
+
+
+def _run_cache_steps(page, steps) -> dict:
+    # Hook calls and month loads run in order inside one evaluate round-trip.
+    return page.evaluate(_RUN_CACHE_STEPS_JS, list(steps))
+
+
+def _wait_for_cards(page, count: int) -> None:
+    page.wait_for_function(_CARD_COUNT_JS, arg=count)
+
+
 def _month_cache_key(month: str, month_rev: str) -> str:
     return f"{MONTH_CACHE_PREFIX}:{MONTH_CACHE_SCHEMA_VERSION}:{month}:{month_rev}"
 
 
-def _storage_set_item(page, store: str, key: str, value: str) -> None:
-    page.evaluate(
-        """([store, key, value]) => {
-          const target = store === "local" ? window.localStorage : window.sessionStorage;
-          target.setItem(key, value);
-        }""",
-        [store, key, value],
-    )
+def _hook_calls(hooks) -> list[tuple[str, str]]:
+    return [("call", hook) for hook in hooks]
 
 
-def _storage_get_item(page, store: str, key: str):
-    return page.evaluate(
-        """([store, key]) => {
-          const target = store === "local" ? window.localStorage : window.sessionStorage;
-          return target.getItem(key);
-        }""",
-        [store, key],
-    )
+def _storage_batch(page, ops) -> list:
+    # ("set", store, key, value) / ("get", store, key) / ("call", hook) in one round-trip;
+    # returns one entry per op (the stored value for "get", None otherwise).
+    return page.evaluate(_STORAGE_BATCH_JS, [list(op) for op in ops])
 
 
-def _seed_storage_with_month_payload(page, store: str, key: str, payload_url: str) -> None:
-    page.evaluate(
-        """async ([store, key, payloadUrl]) => {
-          const target = store === "local" ? window.localStorage : window.sessionStorage;
-          const payload = await fetch(payloadUrl, { cache: "no-store" }).then((r) => r.json());
-          target.setItem(key, JSON.stringify(payload));
-        }""",
-        [store, key, payload_url],
-    )
+def _seed_step(store: str, key: str, payload_url: str) -> dict:
+    # Cache step that copies a month payload into local/session storage under `key`.
+    return {"seedStore": store, "key": key, "payloadUrl": payload_url}
 
 
-def test_explore_has_search_button_and_no_auto_load(browser, synthetic_site):
-    context = browser.new_context()
-    page, urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
-    page.wait_for_timeout(150)
+def test_explore_has_search_button_and_no_auto_load(fresh_page, synthetic_site):
+    page, urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
 
     assert page.get_by_test_id("search-run-btn").count() == 1
     assert page.locator("input[data-tag-category]").count() > 0
-    assert _month_payload_request_count(urls) == 0
-    assert page.locator(".paper-card").count() == 0
-    meta = page.get_by_test_id("results-meta").inner_text()
+    assert not _month_request_within(page)
+    assert len(urls) == 0
+    snap = _snapshot(page)
+    assert snap["cards"] == 0
+    meta = snap["meta"]
     assert "Showing" not in meta
     assert "Loading" not in meta
 
-    context.close()
 
-
-def test_explore_empty_search_click_loads_all_months(browser, synthetic_site):
-    context = browser.new_context()
-    page, urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
+def test_explore_empty_search_click_loads_all_months(fresh_page, synthetic_site):
+    page, urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
     page.get_by_test_id("search-run-btn").click()
-    stats = _wait_for_stats(page, "() => window.__digestTestHooks.getCacheStats().cumulative.network_hits >= 2")
+    stats = _wait_for_stats(page, _NETWORK_HITS_2_JS)
     cumulative = _cumulative(stats)
     last_run = _last_run(stats)
 
-    assert _month_payload_request_count(urls) == 2
+    assert len(urls) == 2
     assert cumulative["network_hits"] == 2
     assert last_run["months_total"] == 2
     assert last_run["months_loaded"] == 2
-    assert page.locator(".paper-card").count() == 3
-    assert page.get_by_test_id("results-meta").inner_text() == "3 results"
-
-    context.close()
+    snap = _snapshot(page)
+    assert snap["cards"] == 3
+    assert snap["meta"] == "3 results"
 
 
-def test_explore_keyword_search_filters_results_after_click(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
+def test_explore_keyword_search_filters_results_after_click(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
     page.get_by_test_id("search-input").fill("Alpha")
     page.get_by_test_id("search-run-btn").click()
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 1")
+    _wait_for_cards(page, 1)
 
     title = page.locator(".paper-card h3").first.inner_text()
     assert "Alpha EEG Foundation Model" in title
 
-    context.close()
-
 
-def test_explore_clear_search_resets_query_tags_and_results(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
+def test_explore_clear_search_resets_query_tags_and_results(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
     page.get_by_test_id("search-input").fill("Alpha")
     page.locator("input[data-tag-category='paper_type'][data-tag-value='new-model']").check()
     page.get_by_test_id("search-run-btn").click()
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 1")
+    _wait_for_cards(page, 1)
 
     page.get_by_role("button", name="Clear search").click()
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 3")
+    _wait_for_cards(page, 3)
 
     assert page.get_by_test_id("search-input").input_value() == ""
     assert page.locator("input[data-tag-category]:checked").count() == 0
     assert page.get_by_test_id("results-meta").inner_text() == "3 results"
 
-    context.close()
 
-
-def test_explore_export_csv_downloads_current_filtered_results(browser, synthetic_site):
-    context = browser.new_context(accept_downloads=True)
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
+def test_explore_export_csv_downloads_current_filtered_results(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
     page.get_by_test_id("search-input").fill("Alpha")
     page.get_by_test_id("search-run-btn").click()
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 1")
+    _wait_for_cards(page, 1)
 
     with page.expect_download() as download_info:
         page.get_by_test_id("export-results-btn").click()
@@ -491,239 +617,129 @@ def test_explore_export_csv_downloads_current_filtered_results(browser, syntheti
     assert "Beta Survey of EEG Foundation Models" not in csv_text
     assert "Gamma Benchmark for EEG-FM Transfer" not in csv_text
 
-    context.close()
-
 
-def test_explore_tag_search_filters_results_after_click(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
+def test_explore_tag_search_filters_results_after_click(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
     page.locator("input[data-tag-category='paper_type'][data-tag-value='survey']").check()
     page.get_by_test_id("search-run-btn").click()
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 1")
+    _wait_for_cards(page, 1)
 
     title = page.locator(".paper-card h3").first.inner_text()
     assert "Beta Survey of EEG Foundation Models" in title
 
-    context.close()
 
-
-def test_explore_tag_term_requires_checkbox_filter(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
+def test_explore_tag_term_requires_checkbox_filter(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
 
     page.get_by_test_id("search-input").fill("time patch")
     page.get_by_test_id("search-run-btn").click()
-    _wait_for_stats(page, "() => window.__digestTestHooks.getCacheStats().cumulative.network_hits >= 2")
+    _wait_for_stats(page, _NETWORK_HITS_2_JS)
     assert page.locator(".paper-card").count() == 0
 
     page.get_by_test_id("search-input").fill("")
     page.locator("input[data-tag-category='tokenization'][data-tag-value='time-patch']").check()
     page.get_by_test_id("search-run-btn").click()
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 2")
+    _wait_for_cards(page, 2)
     assert page.locator(".paper-card").count() == 2
 
-    context.close()
-
 
-def test_explore_meta_does_not_increment_before_search(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
+def test_explore_meta_does_not_increment_before_search(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
 
     meta = page.get_by_test_id("results-meta").inner_text()
     assert "Loading " not in meta
     assert "Showing " not in meta
 
-    context.close()
-
 
-def test_month_page_network_path_on_full_cache_miss(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/digest/2025-01/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
-    page.evaluate(
-        """() => window.__digestTestHooks.loadMonthPayloadForTest({
-          month: "2025-01",
-          jsonPath: "/digest/2025-01/papers.json",
-          view: "month",
-          monthRev: "rev-network-test"
-        })"""
-    )
-    stats = page.evaluate("() => window.__digestTestHooks.getCacheStats()")
+def test_month_page_network_path_on_full_cache_miss(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/digest/2025-01/index.html")
+    stats = _run_cache_steps(page, [*_RESET_ALL, _load_step("rev-network-test")])
     cumulative = _cumulative(stats)
     assert cumulative["network_hits"] == 1
     assert cumulative["cache_writes"] == 1
     assert cumulative["local_hits"] == 0
     assert cumulative["map_hits"] == 0
 
-    context.close()
-
 
-def test_month_page_local_path_when_mem_miss_local_hit(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/digest/2025-01/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
-    page.evaluate(
-        """() => window.__digestTestHooks.loadMonthPayloadForTest({
-          month: "2025-01",
-          jsonPath: "/digest/2025-01/papers.json",
-          view: "month",
-          monthRev: "rev-local-test"
-        })"""
-    )
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
-    page.evaluate(
-        """() => window.__digestTestHooks.loadMonthPayloadForTest({
-          month: "2025-01",
-          jsonPath: "/digest/2025-01/papers.json",
-          view: "month",
-          monthRev: "rev-local-test"
-        })"""
+def test_month_page_local_path_when_mem_miss_local_hit(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/digest/2025-01/index.html")
+    stats = _run_cache_steps(
+        page,
+        [*_RESET_ALL, _load_step("rev-local-test"), *_RESET_MEM, _load_step("rev-local-test")],
     )
-    stats = page.evaluate("() => window.__digestTestHooks.getCacheStats()")
     cumulative = _cumulative(stats)
     assert cumulative["local_hits"] == 1
     assert cumulative["network_hits"] == 0
     assert cumulative["map_hits"] == 0
 
-    context.close()
-
 
-def test_month_page_map_path_when_mem_hit(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/digest/2025-01/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
-    page.evaluate(
-        """() => window.__digestTestHooks.loadMonthPayloadForTest({
-          month: "2025-01",
-          jsonPath: "/digest/2025-01/papers.json",
-          view: "month",
-          monthRev: "rev-map-test"
-        })"""
-    )
-    page.evaluate("() => window.__digestTestHooks.resetCacheStatsForTest()")
-    page.evaluate(
-        """() => window.__digestTestHooks.loadMonthPayloadForTest({
-          month: "2025-01",
-          jsonPath: "/digest/2025-01/papers.json",
-          view: "month",
-          monthRev: "rev-map-test"
-        })"""
+def test_month_page_map_path_when_mem_hit(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/digest/2025-01/index.html")
+    stats = _run_cache_steps(
+        page,
+        [
+            *_RESET_ALL,
+            _load_step("rev-map-test"),
+            "resetCacheStatsForTest",
+            _load_step("rev-map-test"),
+        ],
     )
-    stats = page.evaluate("() => window.__digestTestHooks.getCacheStats()")
     cumulative = _cumulative(stats)
     assert cumulative["map_hits"] == 1
     assert cumulative["network_hits"] == 0
 
-    context.close()
-
 
-def test_month_page_renders_null_featured_card(browser, synthetic_site_with_null_featured_month):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site_with_null_featured_month['base_url']}/digest/2025-01/index.html", wait_until="networkidle")
+def test_month_page_renders_null_featured_card(fresh_page, synthetic_site_with_null_featured_month):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site_with_null_featured_month['base_url']}/digest/2025-01/index.html")
 
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 2")
+    _wait_for_cards(page, 2)
     card = page.get_by_test_id("featured-empty-card")
     assert card.count() == 1
     assert card.inner_text().strip() == "No featured paper this month. Check back soon!"
 
-    context.close()
-
 
-def test_search_network_fallback_on_miss(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
+def test_search_network_fallback_on_miss(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
+    _run_cache_steps(page, _RESET_ALL)
     page.get_by_test_id("search-run-btn").click()
-    stats = _wait_for_stats(page, "() => window.__digestTestHooks.getCacheStats().cumulative.network_hits >= 2")
+    stats = _wait_for_stats(page, _NETWORK_HITS_2_JS)
     cumulative = _cumulative(stats)
     assert cumulative["network_hits"] == 2
     assert cumulative["cache_writes"] >= 2
 
-    context.close()
-
 
-def test_search_local_hit_after_same_tab_navigation(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
+def test_search_local_hit_after_same_tab_navigation(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
+    _run_cache_steps(page, _RESET_ALL)
     page.get_by_test_id("search-run-btn").click()
-    _wait_for_stats(page, "() => window.__digestTestHooks.getCacheStats().cumulative.network_hits >= 2")
+    _wait_for_stats(page, _NETWORK_HITS_2_JS)
 
     # Navigate within the same tab so persistent cache survives while JS memory is rebuilt.
-    page.goto(f"{synthetic_site['base_url']}/index.html", wait_until="networkidle")
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
+    _goto(page, f"{synthetic_site['base_url']}/index.html")
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
+    _run_cache_steps(page, _RESET_MEM)
     page.get_by_test_id("search-run-btn").click()
-    stats = _wait_for_stats(page, "() => window.__digestTestHooks.getCacheStats().cumulative.local_hits >= 2")
+    stats = _wait_for_stats(page, _LOCAL_HITS_2_JS)
     cumulative = _cumulative(stats)
     assert cumulative["local_hits"] >= 2
     assert cumulative["network_hits"] == 0
 
-    context.close()
-
 
-def test_search_map_hit_in_same_runtime(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
+def test_search_map_hit_in_same_runtime(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
+    _run_cache_steps(page, _RESET_ALL)
     page.get_by_test_id("search-run-btn").click()
-    _wait_for_stats(page, "() => window.__digestTestHooks.getCacheStats().cumulative.network_hits >= 2")
+    _wait_for_stats(page, _NETWORK_HITS_2_JS)
     page.evaluate("() => window.__digestTestHooks.resetCacheStatsForTest()")
     page.get_by_test_id("search-run-btn").click()
     stats = _wait_for_stats(page, "() => window.__digestTestHooks.getCacheStats().cumulative.map_hits >= 2")
@@ -731,51 +747,32 @@ def test_search_map_hit_in_same_runtime(browser, synthetic_site):
     assert cumulative["map_hits"] >= 2
     assert cumulative["network_hits"] == 0
 
-    context.close()
-
 
-def test_search_local_hit_in_new_tab_same_origin(browser, synthetic_site):
-    context = browser.new_context()
-    page1, _urls1 = _tracked_page(context)
-    page1.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
-    page1.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
+def test_search_local_hit_in_new_tab_same_origin(fresh_page, context, synthetic_site):
+    page1, _urls1 = fresh_page
+    _goto(page1, f"{synthetic_site['base_url']}/explore/index.html")
+    _run_cache_steps(page1, _RESET_ALL)
     page1.get_by_test_id("search-run-btn").click()
-    _wait_for_stats(page1, "() => window.__digestTestHooks.getCacheStats().cumulative.network_hits >= 2")
+    _wait_for_stats(page1, _NETWORK_HITS_2_JS)
 
-    page2, _urls2 = _tracked_page(context)
-    page2.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
-    page2.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
-    page2.get_by_test_id("search-run-btn").click()
-    stats = _wait_for_stats(page2, "() => window.__digestTestHooks.getCacheStats().cumulative.local_hits >= 2")
+    # A second tab must see the first tab's localStorage, so skip the fresh-storage reset.
+    page2, _urls2 = _tracked_page(context, fresh_storage=False)
+    try:
+        _goto(page2, f"{synthetic_site['base_url']}/explore/index.html")
+        _run_cache_steps(page2, _RESET_MEM)
+        page2.get_by_test_id("search-run-btn").click()
+        stats = _wait_for_stats(page2, _LOCAL_HITS_2_JS)
+    finally:
+        page2.close()
     cumulative = _cumulative(stats)
     assert cumulative["local_hits"] >= 2
     assert cumulative["network_hits"] == 0
 
-    context.close()
 
-
-def test_search_last_run_resets_each_click_and_cumulative_accumulates(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
+def test_search_last_run_resets_each_click_and_cumulative_accumulates(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
+    _run_cache_steps(page, _RESET_ALL)
 
     page.get_by_test_id("search-run-btn").click()
     first = _wait_for_stats(
@@ -814,184 +811,80 @@ def test_search_last_run_resets_each_click_and_cumulative_accumulates(browser, s
     assert second_cumulative["network_hits"] == first_cumulative["network_hits"]
     assert second_cumulative["map_hits"] >= first_cumulative["map_hits"] + 2
 
-    context.close()
-
 
-def test_month_page_month_rev_change_forces_network_refetch(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/digest/2025-01/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
-    page.evaluate(
-        """() => window.__digestTestHooks.loadMonthPayloadForTest({
-          month: "2025-01",
-          jsonPath: "/digest/2025-01/papers.json",
-          view: "month",
-          monthRev: "rev-A"
-        })"""
-    )
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
-    page.evaluate(
-        """() => window.__digestTestHooks.loadMonthPayloadForTest({
-          month: "2025-01",
-          jsonPath: "/digest/2025-01/papers.json",
-          view: "month",
-          monthRev: "rev-B"
-        })"""
+def test_month_page_month_rev_change_forces_network_refetch(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/digest/2025-01/index.html")
+    stats = _run_cache_steps(
+        page, [*_RESET_ALL, _load_step("rev-A"), *_RESET_MEM, _load_step("rev-B")]
     )
-    stats = page.evaluate("() => window.__digestTestHooks.getCacheStats()")
     cumulative = _cumulative(stats)
     assert cumulative["network_hits"] == 1
     assert cumulative["local_hits"] == 0
     assert cumulative["map_hits"] == 0
 
-    context.close()
 
-
-def test_month_page_legacy_session_entry_migrates_to_local(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
+def test_month_page_legacy_session_entry_migrates_to_local(fresh_page, synthetic_site):
+    page, _urls = fresh_page
     month = "2025-01"
     month_rev = "rev-migration-test"
     key = _month_cache_key(month, month_rev)
-    page.goto(f"{synthetic_site['base_url']}/digest/2025-01/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
-    _seed_storage_with_month_payload(page, "session", key, "/digest/2025-01/papers.json")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
-    page.evaluate(
-        f"""() => window.__digestTestHooks.loadMonthPayloadForTest({{
-          month: "{month}",
-          jsonPath: "/digest/2025-01/papers.json",
-          view: "month",
-          monthRev: "{month_rev}"
-        }})"""
+    _goto(page, f"{synthetic_site['base_url']}/digest/2025-01/index.html")
+    stats = _run_cache_steps(
+        page,
+        [
+            *_RESET_ALL,
+            _seed_step("session", key, "/digest/2025-01/papers.json"),
+            *_RESET_MEM,
+            _load_step(month_rev, month),
+        ],
     )
-    stats = page.evaluate("() => window.__digestTestHooks.getCacheStats()")
     cumulative = _cumulative(stats)
     assert cumulative["network_hits"] == 0
     assert cumulative["local_hits"] == 1
-    assert _storage_get_item(page, "local", key) is not None
-    assert _storage_get_item(page, "session", key) is None
-
-    context.close()
+    local_entry, session_entry = _storage_batch(
+        page, [("get", "local", key), ("get", "session", key)]
+    )
+    assert local_entry is not None
+    assert session_entry is None
 
 
-def test_month_page_corrupt_local_entry_removed_and_refetched(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
+def test_month_page_corrupt_local_entry_removed_and_refetched(fresh_page, synthetic_site):
+    page, _urls = fresh_page
     month = "2025-01"
     month_rev = "rev-corrupt-local-test"
     key = _month_cache_key(month, month_rev)
-    page.goto(f"{synthetic_site['base_url']}/digest/2025-01/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
-    _storage_set_item(page, "local", key, "{this-is:not-json")
-    page.evaluate(
-        f"""() => window.__digestTestHooks.loadMonthPayloadForTest({{
-          month: "{month}",
-          jsonPath: "/digest/2025-01/papers.json",
-          view: "month",
-          monthRev: "{month_rev}"
-        }})"""
+    _goto(page, f"{synthetic_site['base_url']}/digest/2025-01/index.html")
+    _storage_batch(
+        page, [*_hook_calls(_RESET_ALL), ("set", "local", key, "{this-is:not-json")]
     )
-    stats = page.evaluate("() => window.__digestTestHooks.getCacheStats()")
+    stats = _run_cache_steps(page, [_load_step(month_rev, month)])
     cumulative = _cumulative(stats)
     assert cumulative["network_hits"] == 1
     assert cumulative["local_hits"] == 0
-    stored = _storage_get_item(page, "local", key)
-    assert stored is not None
-    parsed = json.loads(stored)
-    assert parsed.get("month") == "2025-01"
+    (stored_month,) = _storage_batch(page, [("getMonth", "local", key)])
+    assert stored_month == "2025-01"
 
-    context.close()
 
-
-def test_search_localstorage_failures_fallback_to_mem_and_network(browser, synthetic_site):
-    context = browser.new_context()
-    context.add_init_script(
-        """() => {
-          const proto = Storage.prototype;
-          const originalGetItem = proto.getItem;
-          const originalSetItem = proto.setItem;
-          const originalRemoveItem = proto.removeItem;
-          proto.getItem = function(key) {
-            if (this === window.localStorage) {
-              throw new Error("local_get_blocked");
-            }
-            return originalGetItem.call(this, key);
-          };
-          proto.setItem = function(key, value) {
-            if (this === window.localStorage) {
-              throw new Error("local_set_blocked");
-            }
-            return originalSetItem.call(this, key, value);
-          };
-          proto.removeItem = function(key) {
-            if (this === window.localStorage) {
-              throw new Error("local_remove_blocked");
-            }
-            return originalRemoveItem.call(this, key);
-          };
-        }"""
-    )
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
+def test_search_localstorage_failures_fallback_to_mem_and_network(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    page.add_init_script(_BLOCK_LOCAL_STORAGE_INIT_SCRIPT)
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
+    _run_cache_steps(page, _RESET_ALL)
     page.get_by_test_id("search-run-btn").click()
-    first = _wait_for_stats(page, "() => window.__digestTestHooks.getCacheStats().cumulative.network_hits >= 2")
+    first = _wait_for_stats(page, _NETWORK_HITS_2_JS)
     first_cumulative = _cumulative(first)
     assert first_cumulative["network_hits"] == 2
     assert first_cumulative["local_hits"] == 0
-    assert page.locator(".paper-card").count() == 3
-    assert page.get_by_test_id("results-meta").inner_text() == "3 results"
+    snap = _snapshot(page)
+    assert snap["cards"] == 3
+    assert snap["meta"] == "3 results"
 
-    context.close()
 
-
-def test_explore_no_partial_cards_rendered_while_loading(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
+def test_explore_no_partial_cards_rendered_while_loading(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
+    _run_cache_steps(page, _RESET_ALL)
 
     paused_routes = []
 
@@ -1002,164 +895,140 @@ def test_explore_no_partial_cards_rendered_while_loading(browser, synthetic_site
         route.continue_()
 
     page.route("**/digest/*/papers.json", _pause_month_payloads)
+    page.evaluate(_WATCH_PARTIAL_CARDS_JS)
     page.get_by_test_id("search-run-btn").click()
-    page.wait_for_function(
-        """() => {
-          const meta = document.querySelector("[data-testid='results-meta']");
-          return Boolean(meta) && meta.textContent === "Searching...";
-        }"""
-    )
-    assert page.locator(".paper-card").count() == 0
-    page.wait_for_timeout(80)
-    assert page.get_by_test_id("results-meta").inner_text() == "Searching..."
-    assert page.locator(".paper-card").count() == 0
+    page.wait_for_selector("[data-testid='results-meta']:text-is('Searching...')")
     page.wait_for_function("() => window.__digestTestHooks.getCacheStats().last_run?.months_total === 2")
     for _ in range(40):
         if len(paused_routes) >= 2:
             break
         page.wait_for_timeout(25)
     assert len(paused_routes) == 2
+    # The observer has watched the whole paused window, so no fixed hold is needed.
+    assert page.evaluate("() => window.__partialCardSeen") is False
+    snap = _snapshot(page)
+    assert snap["meta"] == "Searching..."
+    assert snap["cards"] == 0
     for route in paused_routes:
         route.continue_()
 
-    _wait_for_stats(page, "() => window.__digestTestHooks.getCacheStats().cumulative.network_hits >= 2")
-    assert page.get_by_test_id("results-meta").inner_text() == "3 results"
-    assert page.locator(".paper-card").count() == 3
+    _wait_for_stats(page, _NETWORK_HITS_2_JS)
+    snap = _snapshot(page)
+    assert snap["meta"] == "3 results"
+    assert snap["cards"] == 3
 
-    context.close()
 
-
-def test_explore_partial_month_fetch_failure_still_returns_final_count(browser, synthetic_site_with_missing_month):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site_with_missing_month['base_url']}/explore/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
-    )
+def test_explore_partial_month_fetch_failure_still_returns_final_count(fresh_page, synthetic_site_with_missing_month):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site_with_missing_month['base_url']}/explore/index.html")
+    _run_cache_steps(page, _RESET_ALL)
 
     page.get_by_test_id("search-run-btn").click()
-    stats = _wait_for_stats(
-        page,
+    page.wait_for_function(
         """() => {
           const cacheStats = window.__digestTestHooks.getCacheStats();
           return Boolean(cacheStats.last_run) && cacheStats.last_run.months_total === 3 && cacheStats.last_run.months_loaded === 3;
         }""",
+        timeout=4000,
     )
-    cumulative = _cumulative(stats)
-    last_run = _last_run(stats)
-    meta = page.get_by_test_id("results-meta").inner_text()
+    snap = _snapshot(page)
+    cumulative = _cumulative(snap["stats"])
+    last_run = _last_run(snap["stats"])
+    meta = snap["meta"]
     assert cumulative["network_hits"] == 2
     assert last_run["months_total"] == 3
     assert last_run["months_loaded"] == 3
-    assert page.locator(".paper-card").count() == 3
+    assert snap["cards"] == 3
     assert meta == "3 results"
     assert "Showing" not in meta
 
-    context.close()
-
 
-def test_clear_session_alias_clears_local_persistent_cache(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
+def test_clear_session_alias_clears_local_persistent_cache(fresh_page, synthetic_site):
+    page, _urls = fresh_page
     month = "2025-01"
     month_rev = "rev-alias-clear-test"
     key = _month_cache_key(month, month_rev)
-    page.goto(f"{synthetic_site['base_url']}/digest/2025-01/index.html", wait_until="networkidle")
-    page.evaluate(
-        """() => {
-          window.__digestTestHooks.clearMemCacheForTest();
-          window.__digestTestHooks.clearPersistentCacheForTest();
-          window.__digestTestHooks.resetCacheStatsForTest();
-        }"""
+    _goto(page, f"{synthetic_site['base_url']}/digest/2025-01/index.html")
+    results = _storage_batch(
+        page,
+        [
+            *_hook_calls(_RESET_ALL),
+            ("set", "local", key, "{}"),
+            ("get", "local", key),
+            ("call", "clearSessionCacheForTest"),
+            ("get", "local", key),
+        ],
     )
-    _storage_set_item(page, "local", key, "{}")
-    assert _storage_get_item(page, "local", key) is not None
-    page.evaluate("() => window.__digestTestHooks.clearSessionCacheForTest()")
-    assert _storage_get_item(page, "local", key) is None
+    before_clear, after_clear = results[-3], results[-1]
+    assert before_clear is not None
+    assert after_clear is None
 
-    context.close()
 
-
-def test_date_from_filter_narrows_results(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
+def test_date_from_filter_narrows_results(fresh_page, synthetic_site):
+    page, _urls = fresh_page
     _goto_explore_and_run_search_to_three_cards(page, synthetic_site)
     page.get_by_test_id("date-from").fill("2025-01-11")
     page.get_by_test_id("date-from").press("Tab")
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 2")
+    _wait_for_cards(page, 2)
     assert page.get_by_test_id("results-meta").inner_text() == "2 results"
     titles = page.locator(".paper-card h3").all_text_contents()
     assert any("Beta Survey" in t for t in titles)
     assert any("Gamma Benchmark" in t for t in titles)
-    context.close()
 
 
-def test_date_to_filter_narrows_results(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
+def test_date_to_filter_narrows_results(fresh_page, synthetic_site):
+    page, _urls = fresh_page
     _goto_explore_and_run_search_to_three_cards(page, synthetic_site)
     # Beta is 2025-01-12; cap must be >= that day to include both January papers.
     page.get_by_test_id("date-to").fill("2025-01-12")
     page.get_by_test_id("date-to").press("Tab")
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 2")
+    _wait_for_cards(page, 2)
     assert page.get_by_test_id("results-meta").inner_text() == "2 results"
     titles = page.locator(".paper-card h3").all_text_contents()
     assert any("Alpha EEG" in t for t in titles)
     assert any("Beta Survey" in t for t in titles)
-    context.close()
 
 
-def test_date_range_filter(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
+def test_date_range_filter(fresh_page, synthetic_site):
+    page, _urls = fresh_page
     _goto_explore_and_run_search_to_three_cards(page, synthetic_site)
     page.get_by_test_id("date-from").fill("2025-01-11")
     page.get_by_test_id("date-from").press("Tab")
     page.get_by_test_id("date-to").fill("2025-01-31")
     page.get_by_test_id("date-to").press("Tab")
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 1")
+    _wait_for_cards(page, 1)
     assert page.get_by_test_id("results-meta").inner_text() == "1 results"
     assert "Beta Survey of EEG Foundation Models" in page.locator(".paper-card h3").first.inner_text()
-    context.close()
 
 
-def test_date_filter_ands_with_tags(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
+def test_date_filter_ands_with_tags(fresh_page, synthetic_site):
+    page, _urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
     page.locator("input[data-tag-category='tokenization'][data-tag-value='time-patch']").check()
     page.get_by_test_id("search-run-btn").click()
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 2")
+    _wait_for_cards(page, 2)
     page.get_by_test_id("date-from").fill("2025-01-12")
     page.get_by_test_id("date-from").press("Tab")
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 1")
+    _wait_for_cards(page, 1)
     assert "Beta Survey of EEG Foundation Models" in page.locator(".paper-card h3").first.inner_text()
-    context.close()
 
 
-def test_date_filter_ands_with_text_query(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
+def test_date_filter_ands_with_text_query(fresh_page, synthetic_site):
+    page, _urls = fresh_page
     _goto_explore_and_run_search_to_three_cards(page, synthetic_site)
     page.get_by_test_id("search-input").fill("Benchmark")
     page.get_by_test_id("search-run-btn").click()
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 1")
+    _wait_for_cards(page, 1)
     page.get_by_test_id("date-from").fill("2025-02-01")
     page.get_by_test_id("date-from").press("Tab")
     page.get_by_test_id("date-to").fill("2025-02-28")
     page.get_by_test_id("date-to").press("Tab")
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 1")
+    _wait_for_cards(page, 1)
     assert "Gamma Benchmark" in page.locator(".paper-card h3").first.inner_text()
-    context.close()
 
 
-def test_date_preset_last_3_months_sets_inputs_and_filters(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
+def test_date_preset_last_3_months_sets_inputs_and_filters(fresh_page, synthetic_site):
+    page, _urls = fresh_page
     _goto_explore_and_run_search_to_three_cards(page, synthetic_site)
     page.get_by_test_id("date-preset-3m").click()
     d_from = page.get_by_test_id("date-from").input_value()
@@ -1168,58 +1037,50 @@ def test_date_preset_last_3_months_sets_inputs_and_filters(browser, synthetic_si
     assert d_from <= d_to
     pubs = _synthetic_published_dates()
     expected = sum(1 for p in pubs if d_from <= p <= d_to)
-    page.wait_for_function(
-        f"() => document.querySelectorAll('.paper-card').length === {expected}",
-    )
+    _wait_for_cards(page, expected)
     assert page.get_by_test_id("results-meta").inner_text() == f"{expected} results"
-    context.close()
 
 
-def test_clear_search_resets_dates(browser, synthetic_site):
-    context = browser.new_context()
-    page, _urls = _tracked_page(context)
+def test_clear_search_resets_dates(fresh_page, synthetic_site):
+    page, _urls = fresh_page
     _goto_explore_and_run_search_to_three_cards(page, synthetic_site)
     page.get_by_test_id("date-from").fill("2025-02-01")
     page.get_by_test_id("date-from").press("Tab")
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 1")
+    _wait_for_cards(page, 1)
     page.get_by_role("button", name="Clear search").click()
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 3")
+    _wait_for_cards(page, 3)
     assert page.get_by_test_id("date-from").input_value() == ""
     assert page.get_by_test_id("date-to").input_value() == ""
     assert page.get_by_test_id("results-meta").inner_text() == "3 results"
-    context.close()
 
 
-def test_tag_checkbox_auto_triggers_load(browser, synthetic_site):
+def test_tag_checkbox_auto_triggers_load(fresh_page, synthetic_site):
     """Checking a tag before clicking Search should auto-load papers and filter live."""
-    context = browser.new_context()
-    page, urls = _tracked_page(context)
-    page.goto(f"{synthetic_site['base_url']}/explore/index.html", wait_until="networkidle")
+    page, urls = fresh_page
+    _goto(page, f"{synthetic_site['base_url']}/explore/index.html")
     # No search yet — zero cards, zero network requests for month payloads.
     assert page.locator(".paper-card").count() == 0
-    assert _month_payload_request_count(urls) == 0
+    assert not _month_request_within(page)
+    assert len(urls) == 0
 
     # Check the "survey" tag — should auto-trigger load and show only Beta Survey.
     page.locator("input[data-tag-category='paper_type'][data-tag-value='survey']").check()
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 1")
+    _wait_for_cards(page, 1)
 
-    assert _month_payload_request_count(urls) == 2  # both months loaded
+    assert len(urls) == 2  # both months loaded
     title = page.locator(".paper-card h3").first.inner_text()
     assert "Beta Survey of EEG Foundation Models" in title
     assert page.get_by_test_id("results-meta").inner_text() == "1 results"
 
-    context.close()
-
 
-def test_csv_export_respects_date_filter(browser, synthetic_site):
-    context = browser.new_context(accept_downloads=True)
-    page, _urls = _tracked_page(context)
+def test_csv_export_respects_date_filter(fresh_page, synthetic_site):
+    page, _urls = fresh_page
     _goto_explore_and_run_search_to_three_cards(page, synthetic_site)
     page.get_by_test_id("date-from").fill("2025-01-11")
     page.get_by_test_id("date-from").press("Tab")
     page.get_by_test_id("date-to").fill("2025-01-31")
     page.get_by_test_id("date-to").press("Tab")
-    page.wait_for_function("() => document.querySelectorAll('.paper-card').length === 1")
+    _wait_for_cards(page, 1)
 
     with page.expect_download() as download_info:
         page.get_by_test_id("export-results-btn").click()
@@ -1230,4 +1091,3 @@ def test_csv_export_respects_date_filter(browser, synthetic_site):
     assert "Beta Survey of EEG Foundation Models" in csv_text
     assert "Alpha EEG Foundation Model" not in csv_text
     assert "Gamma Benchmark for EEG-FM Transfer" not in csv_text
-    context.close()
@@ -1,54 +1,53 @@
 from pathlib import Path
 
+_SITE_JS = (Path(__file__).resolve().parent.parent / "docs" / "assets" / "site.js").read_text(encoding="utf-8")
+
 
 def test_site_js_defines_month_cache_primitives():
-    site_js = Path("docs/assets/site.js").read_text(encoding="utf-8")
-    assert 'const MONTH_CACHE_SCHEMA_VERSION = "v1";' in site_js
-    assert 'const MONTH_CACHE_PREFIX = "eegfm:monthPayload";' in site_js
-    assert "const monthPayloadMem = new Map();" in site_js
-    assert "function buildMonthCacheKey(month, monthRev)" in site_js
-    assert "function getMonthPayloadFromCache(month, monthRev)" in site_js
-    assert "function setMonthPayloadCache(month, monthRev, payload)" in site_js
-    assert "async function loadMonthPayloadCached({ month, jsonPath, view, monthRev })" in site_js
-    assert "function currentMonthCacheStats()" in site_js
-    assert "window.localStorage" in site_js
+    assert 'const MONTH_CACHE_SCHEMA_VERSION = "v1";' in _SITE_JS
+    assert 'const MONTH_CACHE_PREFIX = "eegfm:monthPayload";' in _SITE_JS
+    assert "const monthPayloadMem = new Map();" in _SITE_JS
+    assert "function buildMonthCacheKey(month, monthRev)" in _SITE_JS
+    assert "function getMonthPayloadFromCache(month, monthRev)" in _SITE_JS
+    assert "function setMonthPayloadCache(month, monthRev, payload)" in _SITE_JS
+    assert "async function loadMonthPayloadCached({ month, jsonPath, view, monthRev })" in _SITE_JS
+    assert "function currentMonthCacheStats()" in _SITE_JS
+    assert "window.localStorage" in _SITE_JS
 
 
 def test_site_js_uses_month_cache_loader_in_month_and_search_paths():
-    site_js = Path("docs/assets/site.js").read_text(encoding="utf-8")
-    assert "payload = await loadMonthPayloadCached({" in site_js
-    assert "monthPayload = await loadMonthPayloadCached({" in site_js
-    assert "const monthRev = normalizeMonthRev(item.month_rev);" in site_js
-    assert "const monthRev = normalizeMonthRev(initialMonthRow?.month_rev);" in site_js
+    assert "payload = await loadMonthPayloadCached({" in _SITE_JS
+    assert "monthPayload = await loadMonthPayloadCached({" in _SITE_JS
+    assert "const monthRev = normalizeMonthRev(item.month_rev);" in _SITE_JS
+    assert "const monthRev = normalizeMonthRev(initialMonthRow?.month_rev);" in _SITE_JS
 
 
 def test_site_js_exposes_test_hooks_and_submit_driven_search():
-    site_js = Path("docs/assets/site.js").read_text(encoding="utf-8")
-    assert "window.__digestTestHooks = {" in site_js
-    assert "loadMonthPayloadForTest: (args) => loadMonthPayloadCached(args)" in site_js
-    assert "getCacheStats: () => currentMonthCacheStats()" in site_js
-    assert "getCacheEntryCounts: () => currentMonthCacheEntryCounts()" in site_js
-    assert "buildCurrentCsvForTest: () => buildResultsCsv(window.__digestAppState?.lastFilteredPapers || [])" in site_js
-    assert "clearMemCacheForTest: () => clearMonthMemCache()" in site_js
-    assert "clearPersistentCacheForTest: () => clearMonthPersistentCache()" in site_js
-    assert "clearSessionCacheForTest: () => clearMonthSessionCache()" in site_js
-    assert "function collectExploreTagOptions(state)" in site_js
-    assert "Object.keys(TAG_LABELS[category] || {})" in site_js
-    assert 'id="search-run-btn"' in site_js
-    assert 'id="export-results-btn"' in site_js
-    assert 'placeholder="title, author, summary"' in site_js
-    assert 'placeholder="title, author, summary, tags"' not in site_js
-    assert "void runExploreSearch(app, state);" in site_js
-    assert "await loadExploreMonthsLazy(app, state, state.monthRows, \"explore\");" in site_js
-    assert "void loadExploreMonthsLazy(app, state, manifest.months, view);" not in site_js
-    assert 'meta.textContent = "Searching...";' in site_js
-    assert "meta.textContent = `${filtered.length} results`;" in site_js
-    assert "Showing ${filtered.length} of ${baseCount} accepted papers ${scopeLabel}.${loadingMeta}" not in site_js
-    assert "const loadingMeta =" not in site_js
-    assert "const legacySession = monthStorage(\"session\");" in site_js
-    assert "local.setItem(key, JSON.stringify(migratedPayload));" in site_js
-    assert "legacySession.removeItem(key);" in site_js
-    assert "removeCorrupt();" in site_js
-    assert "local.removeItem(key);" in site_js
-    assert "last_run:" in site_js
-    assert "cumulative," in site_js
+    assert "window.__digestTestHooks = {" in _SITE_JS
+    assert "loadMonthPayloadForTest: (args) => loadMonthPayloadCached(args)" in _SITE_JS
+    assert "getCacheStats: () => currentMonthCacheStats()" in _SITE_JS
+    assert "getCacheEntryCounts: () => currentMonthCacheEntryCounts()" in _SITE_JS
+    assert "buildCurrentCsvForTest: () => buildResultsCsv(window.__digestAppState?.lastFilteredPapers || [])" in _SITE_JS
+    assert "clearMemCacheForTest: () => clearMonthMemCache()" in _SITE_JS
+    assert "clearPersistentCacheForTest: () => clearMonthPersistentCache()" in _SITE_JS
+    assert "clearSessionCacheForTest: () => clearMonthSessionCache()" in _SITE_JS
+    assert "function collectExploreTagOptions(state)" in _SITE_JS
+    assert "Object.keys(TAG_LABELS[category] || {})" in _SITE_JS
+    assert 'id="search-run-btn"' in _SITE_JS
+    assert 'id="export-results-btn"' in _SITE_JS
+    assert 'placeholder="title, author, summary"' in _SITE_JS
+    assert 'placeholder="title, author, summary, tags"' not in _SITE_JS
+    assert "void runExploreSearch(app, state);" in _SITE_JS
+    assert "await loadExploreMonthsLazy(app, state, state.monthRows, \"explore\");" in _SITE_JS
+    assert "void loadExploreMonthsLazy(app, state, manifest.months, view);" not in _SITE_JS
+    assert 'meta.textContent = "Searching...";' in _SITE_JS
+    assert "meta.textContent = `${filtered.length} results`;" in _SITE_JS
+    assert "Showing ${filtered.length} of ${baseCount} accepted papers ${scopeLabel}.${loadingMeta}" not in _SITE_JS
+    assert "const loadingMeta =" not in _SITE_JS
+    assert "const legacySession = monthStorage(\"session\");" in _SITE_JS
+    assert "local.setItem(key, JSON.stringify(migratedPayload));" in _SITE_JS
+    assert "legacySession.removeItem(key);" in _SITE_JS
+    assert "removeCorrupt();" in _SITE_JS
+    assert "local.removeItem(key);" in _SITE_JS
+    assert "last_run:" in _SITE_JS
+    assert "cumulative," in _SITE_JS
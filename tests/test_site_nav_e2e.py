@@ -7,8 +7,7 @@ from pathlib import Path
 
 import pytest
 
-playwright_sync_api = pytest.importorskip("playwright.sync_api")
-sync_playwright = playwright_sync_api.sync_playwright
+pytestmark = pytest.mark.e2e
 
 
 REPO_DOCS_ROOT = Path(__file__).resolve().parent.parent / "docs"
@@ -40,21 +39,8 @@ def real_docs_site():
         server.server_close()
 
 
-@pytest.fixture(scope="module")
-def browser():
-    with sync_playwright() as p:
-        try:
-            browser = p.chromium.launch(headless=True)
-        except Exception as exc:  # pragma: no cover - environment dependent
-            pytest.skip(f"Playwright browser unavailable: {exc}")
-        try:
-            yield browser
-        finally:
-            browser.close()
-
-
 def test_home_page_renders(browser, real_docs_site):
-    context = browser.new_context()
+    context = browser.new_context(service_workers="block")
     try:
         page = context.new_page()
         page.goto(f"{real_docs_site['base_url']}/index.html")
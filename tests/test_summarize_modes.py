@@ -1,8 +1,8 @@
 import json
-from pathlib import Path
+
+import pytest
 
 from eegfm_digest.summarize import summarize_paper
-from eegfm_digest.triage import load_schema
 
 
 class FakeCallResult:
@@ -10,10 +10,64 @@ class FakeCallResult:
         self.text = text
 
 
+_PAYLOAD_MARKER = "PAYLOAD:\n"
+_DEFAULT_SUMMARY_JSON = json.dumps(
+    {
+        "arxiv_id_base": "2501.10000",
+        "title": "EEG FM",
+        "published_date": "2025-01-10",
+        "categories": ["cs.LG"],
+        "paper_type": "method",
+        "one_liner": "A concise summary line for the digest.",
+        "detailed_summary": (
+            "This paper proposes a deterministic EEG representation method that combines "
+            "self-supervised pretraining and lightweight finetuning for transfer. "
+            "The core novelty is its stable objective and architecture choices designed "
+            "for reproducible downstream performance across benchmarks."
+        ),
+        "unique_contribution": "A deterministic contribution sentence.",
+        "key_points": ["k1 point", "k2 point", "k3 point"],
+        "data_scale": {
+            "datasets": ["Dataset-A"],
+            "subjects": 10,
+            "eeg_hours": 2.5,
+            "channels": 64,
+        },
+        "method": {
+            "architecture": "Transformer",
+            "objective": "Masked prediction",
+            "pretraining": "Self-supervised pretraining",
+            "finetuning": "Linear probe",
+        },
+        "evaluation": {
+            "tasks": ["classification"],
+            "benchmarks": ["Benchmark-A"],
+            "headline_results": ["Improved AUROC"],
+        },
+        "open_source": {
+            "code_url": None,
+            "weights_url": None,
+            "license": None,
+        },
+        "tags": {
+            "paper_type": ["eeg-fm"],
+            "backbone": ["transformer"],
+            "objective": ["masked-reconstruction"],
+            "tokenization": ["time-patch"],
+            "topology": ["fixed-montage"],
+        },
+        "limitations": ["limited cohorts", "needs broader evaluation"],
+        "used_fulltext": True,
+        "notes": "placeholder",
+    }
+)
+
+
 class CaptureLLM:
     def __init__(self, token_result):
         self.token_result = token_result
         self.prompts: list[str] = []
+        self.payloads: list[dict] = []
 
     def count_tokens(self, content: str) -> int:
         if isinstance(self.token_result, Exception):
@@ -22,58 +76,10 @@ class CaptureLLM:
 
     def call(self, prompt, schema=None):  # noqa: ANN001
         self.prompts.append(prompt)
-        return FakeCallResult(
-            json.dumps(
-                {
-                    "arxiv_id_base": "2501.10000",
-                    "title": "EEG FM",
-                    "published_date": "2025-01-10",
-                    "categories": ["cs.LG"],
-                    "paper_type": "method",
-                    "one_liner": "A concise summary line for the digest.",
-                    "detailed_summary": (
-                        "This paper proposes a deterministic EEG representation method that combines "
-                        "self-supervised pretraining and lightweight finetuning for transfer. "
-                        "The core novelty is its stable objective and architecture choices designed "
-                        "for reproducible downstream performance across benchmarks."
-                    ),
-                    "unique_contribution": "A deterministic contribution sentence.",
-                    "key_points": ["k1 point", "k2 point", "k3 point"],
-                    "data_scale": {
-                        "datasets": ["Dataset-A"],
-                        "subjects": 10,
-                        "eeg_hours": 2.5,
-                        "channels": 64,
-                    },
-                    "method": {
-                        "architecture": "Transformer",
-                        "objective": "Masked prediction",
-                        "pretraining": "Self-supervised pretraining",
-                        "finetuning": "Linear probe",
-                    },
-                    "evaluation": {
-                        "tasks": ["classification"],
-                        "benchmarks": ["Benchmark-A"],
-                        "headline_results": ["Improved AUROC"],
-                    },
-                    "open_source": {
-                        "code_url": None,
-                        "weights_url": None,
-                        "license": None,
-                    },
-                    "tags": {
-                        "paper_type": ["eeg-fm"],
-                        "backbone": ["transformer"],
-                        "objective": ["masked-reconstruction"],
-                        "tokenization": ["time-patch"],
-                        "topology": ["fixed-montage"],
-                    },
-                    "limitations": ["limited cohorts", "needs broader evaluation"],
-                    "used_fulltext": True,
-                    "notes": "placeholder",
-                }
-            )
-        )
+        _, marker, payload = prompt.partition(_PAYLOAD_MARKER)
+        if marker:
+            self.payloads.append(json.loads(payload))
+        return FakeCallResult(_DEFAULT_SUMMARY_JSON)
 
 
 PAPER = {
@@ -99,13 +105,7 @@ SLICES = {
 }
 
 
-def _payload_from_prompt(prompt: str) -> dict:
-    marker = "PAYLOAD:\n"
-    return json.loads(prompt.split(marker, 1)[1])
-
-
-def test_summarize_uses_fulltext_when_under_token_limit():
-    schema = load_schema(Path("schemas/summary.json"))
+def test_summarize_uses_fulltext_when_under_token_limit(summary_schema):
     llm = CaptureLLM(token_result=50)
     summarize_paper(
         paper=PAPER,
@@ -117,17 +117,21 @@ def test_summarize_uses_fulltext_when_under_token_limit():
         llm=llm,
         prompt_template="PAYLOAD:\n{{INPUT_JSON}}",
         repair_template="schema={{SCHEMA_JSON}} bad={{BAD_OUTPUT}}",
-        schema=schema,
+        schema=summary_schema,
         max_input_tokens=100,
     )
-    payload = _payload_from_prompt(llm.prompts[0])
+    payload = llm.payloads[0]
     assert "fulltext" in payload
     assert "fulltext_slices" not in payload
 
 
-def test_summarize_uses_slices_when_over_token_limit():
-    schema = load_schema(Path("schemas/summary.json"))
-    llm = CaptureLLM(token_result=500)
+@pytest.mark.parametrize(
+    "token_result",
+    [500, RuntimeError("count failed")],
+    ids=["over_token_limit", "count_tokens_fails"],
+)
+def test_summarize_uses_slices(summary_schema, token_result):
+    llm = CaptureLLM(token_result=token_result)
     summarize_paper(
         paper=PAPER,
         triage=TRIAGE,
@@ -138,38 +142,15 @@ def test_summarize_uses_slices_when_over_token_limit():
         llm=llm,
         prompt_template="PAYLOAD:\n{{INPUT_JSON}}",
         repair_template="schema={{SCHEMA_JSON}} bad={{BAD_OUTPUT}}",
-        schema=schema,
+        schema=summary_schema,
         max_input_tokens=100,
     )
-    payload = _payload_from_prompt(llm.prompts[0])
+    payload = llm.payloads[0]
     assert "fulltext" not in payload
     assert payload["fulltext_slices"]["methods"] == "c"
 
 
-def test_summarize_uses_slices_when_count_tokens_fails():
-    schema = load_schema(Path("schemas/summary.json"))
-    llm = CaptureLLM(token_result=RuntimeError("count failed"))
-    summarize_paper(
-        paper=PAPER,
-        triage=TRIAGE,
-        raw_fulltext="long full text",
-        fulltext_slices=SLICES,
-        used_fulltext=True,
-        notes="meta",
-        llm=llm,
-        prompt_template="PAYLOAD:\n{{INPUT_JSON}}",
-        repair_template="schema={{SCHEMA_JSON}} bad={{BAD_OUTPUT}}",
-        schema=schema,
-        max_input_tokens=100,
-    )
-    payload = _payload_from_prompt(llm.prompts[0])
-    assert "fulltext" not in payload
-    assert "fulltext_slices" in payload
-
-
-def test_summarize_normalizes_paper_type_and_numeric_fields():
-    schema = load_schema(Path("schemas/summary.json"))
-
+def test_summarize_normalizes_paper_type_and_numeric_fields(summary_schema):
     class ListPaperTypeLLM(CaptureLLM):
         def call(self, prompt, schema=None):  # noqa: ANN001
             self.prompts.append(prompt)
@@ -226,7 +207,7 @@ def test_summarize_normalizes_paper_type_and_numeric_fields():
         llm=llm,
         prompt_template="PAYLOAD:\n{{INPUT_JSON}}",
         repair_template="schema={{SCHEMA_JSON}} bad={{BAD_OUTPUT}}",
-        schema=schema,
+        schema=summary_schema,
         max_input_tokens=100,
     )
     assert out["paper_type"] == "new_model"
@@ -234,3 +215,59 @@ def test_summarize_normalizes_paper_type_and_numeric_fields():
     assert out["data_scale"]["eeg_hours"] == 20000.0
     assert out["data_scale"]["channels"] == 64.0
     assert len(out["key_points"]) >= 2
+
+
+def test_summarize_locally_repairs_missing_containers_without_second_call(summary_schema):
+    class DriftingLLM(CaptureLLM):
+        def call(self, prompt, schema=None):  # noqa: ANN001
+            data = json.loads(super().call(prompt, schema).text)
+            del data["open_source"]
+            del data["method"]["finetuning"]
+            return FakeCallResult(json.dumps(data))
+
+    llm = DriftingLLM(token_result=50)
+    out = summarize_paper(
+        paper=PAPER,
+        triage=TRIAGE,
+        raw_fulltext="long full text",
+        fulltext_slices=SLICES,
+        used_fulltext=True,
+        notes="meta",
+        llm=llm,
+        prompt_template="PAYLOAD:\n{{INPUT_JSON}}",
+        repair_template="schema={{SCHEMA_JSON}} bad={{BAD_OUTPUT}}",
+        schema=summary_schema,
+        max_input_tokens=100,
+    )
+    assert len(llm.prompts) == 1
+    assert out["notes"].endswith(";summary_local_repair")
+    assert out["open_source"] == {"code_url": None, "weights_url": None, "license": None}
+    assert out["method"]["finetuning"] is None
+
+
+def test_summarize_wrong_type_container_falls_through_to_llm_repair(summary_schema):
+    class DriftingLLM(CaptureLLM):
+        def call(self, prompt, schema=None):  # noqa: ANN001
+            data = json.loads(super().call(prompt, schema).text)
+            if len(self.prompts) == 1:
+                data["method"] = "Transformer encoder with masked pretraining"
+            return FakeCallResult(json.dumps(data))
+
+    llm = DriftingLLM(token_result=50)
+    out = summarize_paper(
+        paper=PAPER,
+        triage=TRIAGE,
+        raw_fulltext="long full text",
+        fulltext_slices=SLICES,
+        used_fulltext=True,
+        notes="meta",
+        llm=llm,
+        prompt_template="PAYLOAD:\n{{INPUT_JSON}}",
+        repair_template="schema={{SCHEMA_JSON}} bad={{BAD_OUTPUT}}",
+        schema=summary_schema,
+        max_input_tokens=100,
+    )
+    assert len(llm.prompts) == 2
+    assert "Transformer encoder with masked pretraining" in llm.prompts[1]
+    assert "summary_local_repair" not in out["notes"]
+    assert out["method"]["architecture"] == "Transformer"